@@ -8,8 +8,10 @@ from players in-game via chat and executing them using Claude.
 
 import asyncio
 import os
+import signal
 import sys
 import httpx
+import orjson
 from dotenv import load_dotenv
 from claude_agent_sdk import query, ClaudeAgentOptions
 
@@ -22,7 +24,39 @@ VSAI_SERVER_URL = "http://localhost:4560"
 MCP_SERVER_PATH = "/Users/jason/Sync/code/Learn/VintageStory-AI/mcp-server"
 GAMEPLAY_TIPS_PATH = "/Users/jason/Sync/code/Learn/VintageStory-AI/GAMEPLAY.md"
 
+# MCP server configuration (constant, shared by every query)
+MCP_CONFIG = {
+    "vsai": {
+        "command": f"{MCP_SERVER_PATH}/bin/python",
+        "args": [f"{MCP_SERVER_PATH}/vsai_server.py"]
+    }
+}
+
+# Adaptive polling: back off while the inbox is empty, tighten after a command
 POLL_INTERVAL_SECONDS = 2
+POLL_INTERVAL_MIN_SECONDS = 0.25
+POLL_INTERVAL_MAX_SECONDS = 10.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# Bound on concurrently running player commands (each query starts an MCP server)
+MAX_CONCURRENT_COMMANDS = 3
+COMMAND_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+
+# Shared HTTP client (created in main) so polls reuse one keep-alive connection
+CLIENT: httpx.AsyncClient | None = None
+
+# Hot-path requests are built once in main and re-sent, skipping URL/header merging
+POLL_REQUEST: httpx.Request | None = None
+PING_REQUEST: httpx.Request | None = None
+
+# Request bodies are pre-encoded with orjson, so the content type is set by hand
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Outgoing chat is queued and posted in batches by flush_outbox()
+OUTBOX: asyncio.Queue[str] = asyncio.Queue()
+OUTBOX_DEBOUNCE_SECONDS = 0.05
+OUTBOX_MAX_BATCH = 10
+OUTBOX_SHUTDOWN_TIMEOUT_SECONDS = 2.0
 
 SYSTEM_PROMPT = """You are an AI bot playing Vintage Story, a survival/crafting game similar to Minecraft.
 
@@ -48,118 +82,195 @@ You control a bot entity in the game world using MCP tools. Players can give you
 Process the player's command and execute it step by step. Announce your progress.
 """
 
+# Per-command prompt header; the gameplay reference is appended from cache
+COMMAND_PROMPT_HEADER = """A player has given you a command in-game.
+
+Player: {player}
+Command: {command}
+
+Execute the command step by step.
+If you encounter problems, explain what happened and ask for help if needed.
+"""
+
+# Options are identical for every command, so build them once
+AGENT_OPTIONS = ClaudeAgentOptions(
+    system_prompt=SYSTEM_PROMPT,
+    mcp_servers=MCP_CONFIG,
+    permission_mode="bypassPermissions"
+)
+
+
+# Sentinel for optional attributes on streamed SDK messages
+_MISSING = object()
+
 
 def log(msg: str) -> None:
     """Print with immediate flush"""
     print(msg, flush=True)
 
 
+# Cached GAMEPLAY.md contents, keyed on (mtime_ns, size) so edits are picked up
+_TIPS_CACHE: tuple[tuple[int, int], str] | None = None
+
+
 def load_gameplay_tips() -> str:
-    """Load gameplay tips from GAMEPLAY.md"""
+    """Load gameplay tips from GAMEPLAY.md, re-reading only when the file changes"""
+    global _TIPS_CACHE
     try:
-        with open(GAMEPLAY_TIPS_PATH, "r") as f:
-            return f.read()
+        st = os.stat(GAMEPLAY_TIPS_PATH)
+        key = (st.st_mtime_ns, st.st_size)
+        if _TIPS_CACHE is not None and _TIPS_CACHE[0] == key:
+            return _TIPS_CACHE[1]
+        # Text mode normalizes CRLF line endings; utf-8-sig drops a leading BOM
+        with open(GAMEPLAY_TIPS_PATH, "r", encoding="utf-8-sig") as f:
+            data = f.read()
+        _TIPS_CACHE = (key, data)
+        return data
     except FileNotFoundError:
         return ""
 
 
-def build_mcp_config() -> dict:
-    """Build MCP server configuration"""
-    return {
-        "vsai": {
-            "command": f"{MCP_SERVER_PATH}/bin/python",
-            "args": [f"{MCP_SERVER_PATH}/vsai_server.py"]
-        }
-    }
+# Cached "Gameplay Reference" prompt tail, paired with the tips string it was built from
+_PROMPT_SUFFIX: tuple[str, str] | None = None
+
+
+def gameplay_prompt_suffix() -> str:
+    """Static tail of the command prompt, rebuilt only when GAMEPLAY.md changes"""
+    global _PROMPT_SUFFIX
+    tips = load_gameplay_tips()
+    if _PROMPT_SUFFIX is None or _PROMPT_SUFFIX[0] is not tips:
+        _PROMPT_SUFFIX = (tips, f"\n## Gameplay Reference\n{tips}\n")
+    return _PROMPT_SUFFIX[1]
 
 
 async def check_server_status() -> dict | None:
-    """Check if the vsai server is running and get status"""
+    """Check if the vsai server is running and get full status (startup banner)"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{VSAI_SERVER_URL}/status", timeout=5.0)
-            if response.status_code == 200:
-                return response.json()
+        response = await CLIENT.get("/status")
+        if response.status_code == 200:
+            return orjson.loads(response.content)
     except (httpx.RequestError, httpx.TimeoutException):
         pass
     return None
 
 
-async def check_inbox() -> list[dict]:
-    """Poll bot_inbox for new messages from players (direct HTTP call)"""
+async def ping() -> bool:
+    """Cheap liveness probe (HEAD /status, no JSON payload)"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{VSAI_SERVER_URL}/bot/inbox",
-                params={"clear": "true"},
-                timeout=5.0
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("messages", [])
+        response = await CLIENT.send(PING_REQUEST)
     except (httpx.RequestError, httpx.TimeoutException):
-        pass
-    return []
+        return False
+    return response.status_code == 200
 
 
-async def send_chat(message: str) -> None:
-    """Send a chat message as the bot (direct HTTP call)"""
+async def poll() -> list[dict] | None:
+    """Drain the bot inbox via /bot/poll.
+
+    Returns None if the server could not be reached, so callers can treat
+    a failed poll as the liveness signal. Empty polls (the common case) are
+    recognised from the X-Inbox-Count header without decoding the body.
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                f"{VSAI_SERVER_URL}/bot/chat",
-                json={"message": message},
-                timeout=5.0
-            )
+        response = await CLIENT.send(POLL_REQUEST)
     except (httpx.RequestError, httpx.TimeoutException):
-        pass
+        return None
+    if response.status_code != 200:
+        return None
+    if response.headers.get("X-Inbox-Count") == "0":
+        return []
+    return orjson.loads(response.content).get("messages", [])
 
 
-async def execute_command(player: str, command: str) -> None:
-    """Execute a player command using Claude"""
-    gameplay_tips = load_gameplay_tips()
+def send_chat(message: str) -> None:
+    """Queue a chat message to be sent as the bot"""
+    OUTBOX.put_nowait(message)
 
-    prompt = f"""A player has given you a command in-game.
 
-Player: {player}
-Command: {command}
+async def flush_outbox() -> None:
+    """Background task: post queued chat messages, coalescing bursts into one request"""
+    while True:
+        batch = [await OUTBOX.get()]
+        while len(batch) < OUTBOX_MAX_BATCH:
+            try:
+                batch.append(await asyncio.wait_for(OUTBOX.get(), OUTBOX_DEBOUNCE_SECONDS))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await CLIENT.post("/bot/chat", content=orjson.dumps({"messages": batch}), headers=JSON_HEADERS)
+        except (httpx.RequestError, httpx.TimeoutException):
+            pass
+        for _ in batch:
+            OUTBOX.task_done()
 
-Execute the command step by step.
-If you encounter problems, explain what happened and ask for help if needed.
 
-## Gameplay Reference
-{gameplay_tips}
-"""
+async def execute_command(player: str, command: str) -> None:
+    """Execute a player command using Claude"""
+    header = COMMAND_PROMPT_HEADER.format_map({"player": player, "command": command})
+    prompt = header + gameplay_prompt_suffix()
 
     log(f"\n{'='*60}")
     log(f"[{player}] {command}")
     log('='*60)
 
-    async for message in query(
-        prompt=prompt,
-        options=ClaudeAgentOptions(
-            system_prompt=SYSTEM_PROMPT,
-            mcp_servers=build_mcp_config(),
-            permission_mode="bypassPermissions"
-        )
-    ):
-        if hasattr(message, "content"):
-            content = message.content
+    async for message in query(prompt=prompt, options=AGENT_OPTIONS):
+        content = getattr(message, "content", _MISSING)
+        if content is not _MISSING:
             if isinstance(content, list):
+                # One write + flush per message rather than per text block
+                parts = []
                 for block in content:
-                    if hasattr(block, "text"):
-                        log(block.text)
+                    text = getattr(block, "text", _MISSING)
+                    if text is not _MISSING:
+                        parts.append(text)
+                if parts:
+                    sys.stdout.write("\n".join(parts) + "\n")
+                    sys.stdout.flush()
             else:
                 log(content)
-        elif hasattr(message, "result"):
-            log(f"\n{message.result}")
+            continue
 
+        result = getattr(message, "result", _MISSING)
+        if result is not _MISSING:
+            log(f"\n{result}")
 
-async def main() -> None:
+
+async def run_command(player: str, command: str) -> None:
+    """Execute one player command, bounded by COMMAND_SEMAPHORE"""
+    async with COMMAND_SEMAPHORE:
+        try:
+            await execute_command(player, command)
+        except Exception as e:
+            log(f"Error: {e}")
+
+
+def unique_commands(messages: list[dict]) -> list[tuple[str, str]]:
+    """(player, command) pairs from an inbox batch, skipping blank and repeated commands"""
+    seen = set()
+    unique = []
+    for msg in messages:
+        command = (msg.get("message") or "").strip()
+        if not command:
+            continue
+        key = (msg.get("player", "Unknown"), command)
+        if key not in seen:
+            seen.add(key)
+            unique.append(key)
+    return unique
+
+
+async def wait_for_stop(stop: asyncio.Event, seconds: float) -> None:
+    """Sleep for up to `seconds`, returning early once shutdown is requested"""
+    try:
+        await asyncio.wait_for(stop.wait(), seconds)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def run_agent() -> None:
     log("Vintage Story AI Bot Agent")
     log("="*40)
     log(f"Server: {VSAI_SERVER_URL}")
-    log(f"Poll interval: {POLL_INTERVAL_SECONDS}s")
+    log(f"Poll interval: {POLL_INTERVAL_MIN_SECONDS}-{POLL_INTERVAL_MAX_SECONDS}s (adaptive)")
     log("")
 
     # Check initial status
@@ -175,43 +286,121 @@ async def main() -> None:
 
     if status.get("bot", {}).get("active"):
         log("\nAnnouncing online status...")
-        await send_chat("I'm online and ready for commands! Say 'Claude: <command>' to give me tasks.")
+        send_chat("I'm online and ready for commands! Say 'Claude: <command>' to give me tasks.")
     else:
         log("\nBot is not spawned. Will spawn when commanded.")
 
     log("\nListening for player commands...")
     log("-" * 40)
 
+    # Ctrl-C / SIGTERM request a clean stop; in-flight commands finish first.
+    # A second signal cancels them, and a third falls back to the default handler.
+    stop = asyncio.Event()
+    in_flight: asyncio.Future | None = None
+    forced = False
+    loop = asyncio.get_running_loop()
+    installed_signals: list[signal.Signals] = []
+
+    def restore_signal_handlers() -> None:
+        while installed_signals:
+            loop.remove_signal_handler(installed_signals.pop())
+
+    def request_stop() -> None:
+        nonlocal forced
+        if not stop.is_set():
+            stop.set()
+            if in_flight is not None:
+                log("\nShutdown pending: waiting for running commands (Ctrl-C again to cancel them)...")
+            return
+        forced = True
+        restore_signal_handlers()
+        if in_flight is not None:
+            log("\nCancelling running commands...")
+            in_flight.cancel()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_stop)
+            installed_signals.append(sig)
+        except NotImplementedError:
+            pass  # Windows: Ctrl-C falls back to KeyboardInterrupt
+
     # Main loop
-    while True:
+    interval = POLL_INTERVAL_SECONDS
+    while not stop.is_set():
         try:
-            # Check if server is still available
-            status = await check_server_status()
-            if status is None:
+            # Poll for commands (even if bot not active - might be a spawn command).
+            # A failed poll doubles as the server liveness check.
+            messages = await poll()
+            if messages is None:
                 log("Lost connection to server. Retrying...")
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                interval = min(interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX_SECONDS)
+                await wait_for_stop(stop, interval)
+                # Wait out the outage with HEAD probes rather than full polls
+                while not stop.is_set() and not await ping():
+                    interval = min(interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX_SECONDS)
+                    await wait_for_stop(stop, interval)
                 continue
 
-            # Poll for commands (even if bot not active - might be a spawn command)
-            messages = await check_inbox()
+            # Commands from the same poll run concurrently instead of back-to-back
+            commands = unique_commands(messages)
+            if commands:
+                in_flight = asyncio.gather(*(run_command(player, command) for player, command in commands))
+                try:
+                    await in_flight
+                except asyncio.CancelledError:
+                    if not forced:
+                        raise
+                    break
+                finally:
+                    in_flight = None
+
+            # Poll quickly right after activity, back off while nothing arrives
+            if messages:
+                interval = POLL_INTERVAL_MIN_SECONDS
+            else:
+                interval = min(interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX_SECONDS)
+            await wait_for_stop(stop, interval)
 
-            for msg in messages:
-                player = msg.get("player", "Unknown")
-                command = msg.get("message", "")
+        except Exception as e:
+            log(f"Error: {e}")
+            await wait_for_stop(stop, POLL_INTERVAL_SECONDS)
 
-                if command:
-                    await execute_command(player, command)
+    restore_signal_handlers()
+    log("\n\nShutting down agent...")
+    send_chat("Going offline. Goodbye!")
 
-            await asyncio.sleep(POLL_INTERVAL_SECONDS)
 
-        except KeyboardInterrupt:
-            log("\n\nShutting down agent...")
-            await send_chat("Going offline. Goodbye!")
-            break
-        except Exception as e:
-            log(f"Error: {e}")
-            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+async def main() -> None:
+    global CLIENT, POLL_REQUEST, PING_REQUEST
+    # Localhost-only traffic: plain HTTP/1.1, no proxy lookup, one long-lived connection
+    CLIENT = httpx.AsyncClient(
+        base_url=VSAI_SERVER_URL,
+        http2=False,
+        trust_env=False,
+        timeout=httpx.Timeout(5.0, connect=1.0),
+        limits=httpx.Limits(max_connections=2, max_keepalive_connections=2, keepalive_expiry=300.0)
+    )
+    POLL_REQUEST = CLIENT.build_request("GET", "/bot/poll", params={"clear": "true"})
+    PING_REQUEST = CLIENT.build_request("HEAD", "/status")
+    flusher = asyncio.create_task(flush_outbox())
+    try:
+        await run_agent()
+    finally:
+        # Deliver queued chat (e.g. the goodbye) before closing the client
+        try:
+            await asyncio.wait_for(OUTBOX.join(), OUTBOX_SHUTDOWN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        flusher.cancel()
+        await CLIENT.aclose()
 
 
 if __name__ == "__main__":
+    # libuv-backed event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
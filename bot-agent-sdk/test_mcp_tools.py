@@ -34,4 +34,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # libuv-backed event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -0,0 +1,71 @@
+"""
+Tests for the bot_blocks visibility cache.
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import vsai_server
+
+
+def make_scan(radius: int) -> dict[str, Any]:
+    """Scan response for a bot standing on flat ground."""
+    blocks = [
+        {"x": x, "y": 100, "z": z, "code": "game:soil", "isSolid": True}
+        for x in range(-radius, radius + 1)
+        for z in range(-radius, radius + 1)
+    ]
+    return {"blocks": blocks, "botPosition": {"x": 0.5, "y": 101.0, "z": 0.5}}
+
+
+@pytest.fixture
+def scan_requests(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Fake the VS API and record every GET the server makes."""
+    requests: list[str] = []
+
+    async def fake_http_get(endpoint: str) -> dict[str, Any]:
+        requests.append(endpoint)
+        return make_scan(3)
+
+    monkeypatch.setattr(vsai_server, "http_get", fake_http_get)
+    monkeypatch.setattr(vsai_server, "blocks_cache", vsai_server.OrderedDict())
+    monkeypatch.setattr(vsai_server, "last_observation", None)
+    monkeypatch.setattr(vsai_server, "last_scan_position", None)
+    return requests
+
+
+class TestBlocksCache:
+    """Tests for reusing visibility passes between bot_blocks calls."""
+
+    def test_consecutive_calls_hit_cache(self, scan_requests: list[str]) -> None:
+        """A second scan from the same spot is served without a request."""
+        first = asyncio.run(vsai_server.handle_bot_blocks({"radius": 3}))
+        second = asyncio.run(vsai_server.handle_bot_blocks({"radius": 3}))
+
+        assert scan_requests == ["/bot/blocks?radius=3"]
+        assert second == first
+
+    def test_post_invalidates_scan_position(
+        self, scan_requests: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """After an action the bot may have moved, so the next scan is fetched."""
+
+        class FakeResponse:
+            content = b"{}"
+
+        class FakeClient:
+            async def post(self, endpoint: str, **kwargs: Any) -> FakeResponse:
+                return FakeResponse()
+
+        monkeypatch.setattr(vsai_server, "http_client", FakeClient())
+
+        async def scan_act_scan() -> None:
+            await vsai_server.handle_bot_blocks({"radius": 3})
+            await vsai_server.http_post("/bot/walk", {"x": 5, "y": 101, "z": 0})
+            await vsai_server.handle_bot_blocks({"radius": 3})
+
+        asyncio.run(scan_act_scan())
+
+        assert len(scan_requests) == 2
@@ -6,14 +6,18 @@ Provides tools for LLMs to control an AI bot in Vintage Story.
 """
 
 import asyncio
-import json
+import math
 import os
+import re
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, NamedTuple
 
+import httpx
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -22,789 +26,942 @@ from vintage_story_core import get_visible_surface_blocks
 # Configuration
 VS_API_BASE_URL = "http://localhost:4560"
 BOT_NAME = os.environ.get("VSAI_BOT_NAME", "Claude")
+WORLD_ORIGIN_OFFSET = int(os.environ.get("VSAI_WORLD_OFFSET", 512000))  # Subtracted from X/Z for player-facing coords
 MOVEMENT_POLL_INTERVAL_SEC = 0.1
+MOVEMENT_LONG_POLL_MS = 5000  # Server holds status polls until the movement state changes
 MOVEMENT_TIMEOUT_SEC = 600  # 10 minutes - complex terrain needs long winding paths
+BLOCKS_CACHE_TTL_SEC = 0.5  # Reuse a visibility pass for repeated scans from the same block
+BLOCKS_CACHE_MAX_ENTRIES = 64
+OBSERVE_CACHE_TTL_SEC = 0.2  # bot_blocks may reuse an observation this fresh
+# Tool results go to an LLM, so indentation only costs tokens; enable it for debugging
+RESULT_JSON_OPTIONS = orjson.OPT_INDENT_2 if os.environ.get("VSAI_PRETTY_JSON") else 0
+REQUEST_TIMEOUT = httpx.Timeout(10.0)
+COMBAT_TIMEOUT = httpx.Timeout(65.0)  # 60 second combat + buffer
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     x: float
     y: float
     z: float
 
     def distance_to(self, other: "Position") -> float:
+        return math.sqrt(self.distance_sq_to(other))
+
+    def distance_sq_to(self, other: "Position") -> float:
+        """Squared distance; use when only comparing distances."""
         dx = self.x - other.x
         dy = self.y - other.y
         dz = self.z - other.z
-        return (dx * dx + dy * dy + dz * dz) ** 0.5
+        return dx * dx + dy * dy + dz * dz
+
+    def to_dict(self) -> dict[str, float]:
+        return {"x": self.x, "y": self.y, "z": self.z}
 
     def __str__(self) -> str:
         return f"({self.x:.1f}, {self.y:.1f}, {self.z:.1f})"
 
 
-def http_get(endpoint: str) -> dict[str, Any]:
-    """Make a GET request to the VS API and return JSON response."""
-    url = f"{VS_API_BASE_URL}{endpoint}"
-    req = Request(url, method="GET")
-    req.add_header("Content-Type", "application/json")
+# Visible surface blocks keyed on (block x, y, z, radius) -> (time, blocks scanned, visible blocks)
+blocks_cache: OrderedDict[tuple[int, int, int, int], tuple[float, int, list[dict[str, Any]]]] = OrderedDict()
 
-    with urlopen(req, timeout=10) as response:
-        return json.loads(response.read().decode())
 
+# Most recent /bot/observe payload as (monotonic time, response), also fed by movement polls
+last_observation: tuple[float, dict[str, Any]] | None = None
 
-def http_post(endpoint: str, data: dict[str, Any], timeout: int = 10) -> dict[str, Any]:
-    """Make a POST request to the VS API with JSON body."""
-    url = f"{VS_API_BASE_URL}{endpoint}"
-    body = json.dumps(data).encode()
-    req = Request(url, data=body, method="POST")
-    req.add_header("Content-Type", "application/json")
 
-    with urlopen(req, timeout=timeout) as response:
-        return json.loads(response.read().decode())
+# Bot position reported by the last /bot/blocks scan as (monotonic time, position)
+last_scan_position: tuple[float, dict[str, float]] | None = None
+
+
+# Default headers for every VS API request, set once on the client below.
+# Bodies are pre-encoded with orjson, so the content type is set by hand.
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Shared keep-alive connection pool to the VS API. Every tool awaits it, so a slow
+# call (goto, attack) never blocks the event loop or other tool calls.
+http_client = httpx.AsyncClient(
+    base_url=VS_API_BASE_URL,
+    headers=JSON_HEADERS,
+    timeout=REQUEST_TIMEOUT,
+    trust_env=False,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=60)
+)
+
+
+async def http_get(endpoint: str) -> dict[str, Any]:
+    """Make a GET request to the VS API and return JSON response."""
+    response = await http_client.get(endpoint)
+    return orjson.loads(response.content)
 
 
-def wait_for_movement_complete() -> dict[str, Any]:
+async def http_post(endpoint: str, data: dict[str, Any], timeout: httpx.Timeout = REQUEST_TIMEOUT) -> dict[str, Any]:
+    """Make a POST request to the VS API with JSON body."""
+    return await http_post_raw(endpoint, orjson.dumps(data), timeout)
+
+
+async def http_post_raw(endpoint: str, body: bytes, timeout: httpx.Timeout = REQUEST_TIMEOUT) -> dict[str, Any]:
+    """POST an already-encoded JSON body to the VS API."""
+    global last_observation, last_scan_position
+    response = await http_client.post(endpoint, content=body, timeout=timeout)
+    # Any action may have moved, despawned or respawned the bot
+    last_observation = None
+    last_scan_position = None
+    return orjson.loads(response.content)
+
+
+def fresh_observation() -> dict[str, Any] | None:
+    """The last observation if it was seen within OBSERVE_CACHE_TTL_SEC, else None."""
+    if last_observation is not None and time.monotonic() - last_observation[0] < OBSERVE_CACHE_TTL_SEC:
+        return last_observation[1]
+    return None
+
+
+async def cached_observe() -> dict[str, Any]:
+    """GET /bot/observe, reusing an observation seen within OBSERVE_CACHE_TTL_SEC."""
+    global last_observation
+    observation = fresh_observation()
+    if observation is not None:
+        return observation
+    observation = await http_get("/bot/observe")
+    if "error" not in observation:
+        last_observation = (time.monotonic(), observation)
+    return observation
+
+
+def interrupt_result(status: dict[str, Any]) -> dict[str, Any]:
+    """Movement result for a combat interrupt reported in a movement status."""
+    interrupt_details = status.get("interruptDetails", {})
+    attacker = interrupt_details.get("attackerCode", "unknown")
+    return {
+        "error": f"Movement interrupted by combat! Attacked by {attacker}",
+        "status": "interrupted",
+        "position": status.get("position", {}),
+        "statusMessage": f"Under attack by {attacker}",
+        "interruptDetails": interrupt_details
+    }
+
+
+async def wait_for_movement_complete() -> dict[str, Any]:
     """
     Poll movement status until the bot reaches destination, gets stuck, or is interrupted.
     Returns the final movement status.
     """
+    global last_observation
     terminal_states = {"idle", "reached", "stuck", "no_task"}
-    start_time = time.time()
+    deadline = time.monotonic() + MOVEMENT_TIMEOUT_SEC
+    etag = ""
 
     while True:
-        if time.time() - start_time > MOVEMENT_TIMEOUT_SEC:
+        if time.monotonic() > deadline:
             return {"error": "Movement timeout", "status": "timeout"}
 
         try:
-            status = http_get("/bot/movement/status")
-        except URLError as e:
+            # Movement status and bot observation in one request; once we hold an
+            # ETag the server blocks until something changes instead of us re-polling
+            response = await http_client.get("/bot/movement/status", params={
+                "include": "observe",
+                "waitChange": MOVEMENT_LONG_POLL_MS,
+                "etag": etag
+            })
+            poll = orjson.loads(response.content)
+        except httpx.TransportError as e:
             return {"error": f"Failed to get status: {e}", "status": "error"}
-
-        if "error" in status:
-            return status
+        etag = response.headers.get("ETag", "")
+
+        if "error" in poll:
+            return poll
+        status = poll.get("movement")
+        if status is None:
+            # Older mods ignore include=observe and return the bare movement status
+            status = poll
+            bot = (await cached_observe()).get("bot", {})
+        else:
+            bot = poll["bot"]
+            last_observation = (time.monotonic(), {"bot": bot})
 
         # Check for combat interrupt - return immediately so agent can respond
         interrupted_value = status.get("interrupted")
         if interrupted_value:
-            interrupt_details = status.get("interruptDetails", {})
-            print(f"[VSAI-PY] Interrupt detected! interrupted={interrupted_value}, details={interrupt_details}", flush=True)
-            return {
-                "error": f"Movement interrupted by combat! Attacked by {interrupt_details.get('attackerCode', 'unknown')}",
-                "status": "interrupted",
-                "position": status.get("position", {}),
-                "statusMessage": f"Under attack by {interrupt_details.get('attackerCode', 'unknown')}",
-                "interruptDetails": interrupt_details
-            }
+            print(f"[VSAI-PY] Interrupt detected! interrupted={interrupted_value}, details={status.get('interruptDetails', {})}", flush=True)
+            return interrupt_result(status)
 
         current_status = status.get("status", "unknown")
         is_active = status.get("isActive", False)
 
         # Check for bot despawn
-        bot_status = http_get("/bot/observe")
-        if "bot" in bot_status:
-            bot_state = bot_status["bot"].get("state", "")
-            in_loaded = bot_status["bot"].get("inLoadedEntities", True)
-            if bot_state == "Despawned" or not in_loaded:
-                return {
-                    "error": "Bot despawned during movement",
-                    "status": "despawned",
-                    "position": status.get("position", {}),
-                    "statusMessage": "Bot unexpectedly despawned"
-                }
+        bot_state = bot.get("state", "")
+        in_loaded = bot.get("inLoadedEntities", True)
+        if bot_state == "Despawned" or not in_loaded:
+            return {
+                "error": "Bot despawned during movement",
+                "status": "despawned",
+                "position": status.get("position", {}),
+                "statusMessage": "Bot unexpectedly despawned"
+            }
 
         # Check for terminal state with no active movement
         if current_status in terminal_states and not is_active:
             # Confirm by waiting one more poll
-            time.sleep(MOVEMENT_POLL_INTERVAL_SEC)
-            confirm = http_get("/bot/movement/status")
+            await asyncio.sleep(MOVEMENT_POLL_INTERVAL_SEC)
+            confirm = await http_get("/bot/movement/status")
 
             # Check confirm for interrupt too (in case damage happened between polls)
             if confirm.get("interrupted"):
-                interrupt_details = confirm.get("interruptDetails", {})
-                return {
-                    "error": f"Movement interrupted by combat! Attacked by {interrupt_details.get('attackerCode', 'unknown')}",
-                    "status": "interrupted",
-                    "position": confirm.get("position", {}),
-                    "statusMessage": f"Under attack by {interrupt_details.get('attackerCode', 'unknown')}",
-                    "interruptDetails": interrupt_details
-                }
+                return interrupt_result(confirm)
 
             if confirm.get("status") in terminal_states and not confirm.get("isActive", False):
                 return confirm
 
-        time.sleep(MOVEMENT_POLL_INTERVAL_SEC)
+        # Servers without long-poll support answer immediately; fall back to fixed polling
+        if not etag:
+            await asyncio.sleep(MOVEMENT_POLL_INTERVAL_SEC)
 
 
 # Create MCP server
 server = Server("vsai")
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    return [
-        Tool(
-            name="bot_status",
-            description="Get the current status of the VS API server and bot.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_spawn",
-            description="Spawn the AI bot at a specific position in the world.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "number", "description": "X coordinate"},
-                    "y": {"type": "number", "description": "Y coordinate (vertical)"},
-                    "z": {"type": "number", "description": "Z coordinate"}
-                },
-                "required": ["x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="bot_despawn",
-            description="Remove the AI bot from the world.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_observe",
-            description="Get detailed observation of the bot's current state including position, health, and surroundings.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_goto",
-            description="Command the bot to walk to a position using the game's built-in A* pathfinding (NavigateTo). Blocks until the bot reaches the destination or gets stuck. Works at long distances with the chunk loading fix. If stuck on terrain obstacles, try routing around them.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "number", "description": "Target X coordinate"},
-                    "y": {"type": "number", "description": "Target Y coordinate (must be at ground level)"},
-                    "z": {"type": "number", "description": "Target Z coordinate"},
-                    "speed": {"type": "number", "description": "Movement speed (default: 0.03)", "default": 0.03},
-                    "relative": {"type": "boolean", "description": "If true, coordinates are relative to current position", "default": False}
-                },
-                "required": ["x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="bot_stop",
-            description="Stop the bot's current movement.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_blocks",
-            description="Scan blocks around the bot in a given radius. Only returns surface blocks (visible with exposed face). Use filter to search for specific block types by keyword.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "radius": {"type": "integer", "description": "Scan radius in blocks (default: 3)", "default": 3},
-                    "filter": {
-                        "type": "string",
-                        "description": "Keyword filter for block codes (case-insensitive). Use comma to match multiple keywords, e.g. 'flint,stone' matches blocks containing 'flint' OR 'stone'."
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_entities",
-            description="Get entities near the bot.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "radius": {"type": "number", "description": "Search radius (default: 10)", "default": 10}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_mine",
-            description="Mine a block using equipped tool. Respects tool tier - drops only if tool tier >= block requirement. Bot should have appropriate tool equipped (pickaxe for stone/ore, axe for wood, etc.). Tool tiers: 0=none, 1=stone/flint, 2=copper, 3=bronze, 4=iron, 5=steel.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "Block X coordinate"},
-                    "y": {"type": "integer", "description": "Block Y coordinate"},
-                    "z": {"type": "integer", "description": "Block Z coordinate"},
-                    "relative": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "If true, coordinates are relative to bot position"
-                    }
-                },
-                "required": ["x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="bot_place",
-            description="Place a block at the specified position.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "Block X coordinate"},
-                    "y": {"type": "integer", "description": "Block Y coordinate"},
-                    "z": {"type": "integer", "description": "Block Z coordinate"},
-                    "blockCode": {"type": "string", "description": "Block code to place (e.g., 'game:stone')"}
-                },
-                "required": ["x", "y", "z", "blockCode"]
-            }
-        ),
-        Tool(
-            name="bot_interact",
-            description="Interact with a block (open/close doors, gates, trapdoors, activate levers, etc.). Simulates right-click on the block.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "Block X coordinate"},
-                    "y": {"type": "integer", "description": "Block Y coordinate"},
-                    "z": {"type": "integer", "description": "Block Z coordinate"},
-                    "relative": {"type": "boolean", "description": "If true, coordinates are relative to bot position", "default": False}
-                },
-                "required": ["x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="players_list",
-            description="Get a list of all online players.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="player_observe",
-            description="Get detailed observation of a specific player.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Player name (case-insensitive)"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="bot_chat",
-            description="Send a chat message as the bot to all players in the game.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {"type": "string", "description": "The message to send"},
-                    "name": {"type": "string", "description": f"Bot name to display (default: '{BOT_NAME}')", "default": BOT_NAME}
-                },
-                "required": ["message"]
-            }
-        ),
-        Tool(
-            name="bot_chat_location",
-            description="Send a chat message with a location, automatically converting absolute coordinates to relative coordinates (subtracts 512000 from X and Z) so they match what players see on screen.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {"type": "string", "description": "Message prefix (e.g., 'Found copper at')"},
-                    "x": {"type": "number", "description": "Absolute X coordinate"},
-                    "y": {"type": "number", "description": "Y coordinate (unchanged)"},
-                    "z": {"type": "number", "description": "Absolute Z coordinate"},
-                    "name": {"type": "string", "description": f"Bot name to display (default: '{BOT_NAME}')", "default": BOT_NAME}
-                },
-                "required": ["message", "x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="screenshot",
-            description="Take a screenshot of the game.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_inventory",
-            description="Get the contents of the bot's inventory, including all slots and hand items.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_collect",
-            description="Pick up a loose surface item (flint, stones, sticks) at a specific position. Bot must be within 5 blocks of the target.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "Block X coordinate"},
-                    "y": {"type": "integer", "description": "Block Y coordinate"},
-                    "z": {"type": "integer", "description": "Block Z coordinate"}
-                },
-                "required": ["x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="bot_inventory_drop",
-            description="Drop an item from the bot's inventory. Spawns the item in the world at the bot's feet.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "slotIndex": {"type": "integer", "description": "Inventory slot index to drop from (0-based)"},
-                    "itemCode": {"type": "string", "description": "Item code to search for and drop (alternative to slotIndex)"},
-                    "quantity": {"type": "integer", "description": "Number of items to drop (default: 1)", "default": 1}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_pickup",
-            description="Pick up a dropped item entity near the bot. If no entityId specified, picks up the nearest item.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entityId": {"type": "integer", "description": "Specific item entity ID to pick up (from bot_entities)"},
-                    "maxDistance": {"type": "number", "description": "Maximum pickup distance (default: 5)", "default": 5}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_inbox",
-            description=f"Read messages sent to the bot by players. Players address the bot with '{BOT_NAME}: <message>' in chat.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "clear": {"type": "boolean", "description": "Clear inbox after reading (default: true)", "default": True},
-                    "limit": {"type": "integer", "description": "Max messages to return (default: 50)", "default": 50}
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_knap",
-            description="Knap a flint or stone tool. Bot must have flint or stone in inventory. Creates knapping surface, completes recipe instantly, gives output to bot.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "recipe": {
-                        "type": "string",
-                        "description": "Tool to make: 'axe', 'knife', 'shovel', 'hoe', 'spear', or 'arrowhead'"
-                    }
-                },
-                "required": ["recipe"]
-            }
-        ),
-        Tool(
-            name="bot_craft",
-            description="Craft an item using grid recipe. Bot must have all required ingredients in inventory. Use for combining knapped tool heads with sticks to make tools.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "recipe": {
-                        "type": "string",
-                        "description": "Output to craft (e.g., 'axe', 'knife', 'shovel', 'spear'). Matches recipes containing this name."
-                    }
-                },
-                "required": ["recipe"]
-            }
-        ),
-        Tool(
-            name="bot_equip",
-            description="Equip an item from inventory to the bot's hand. Swaps with any item currently in hand.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "slotIndex": {
-                        "type": "integer",
-                        "description": "Inventory slot index to equip from (0-based)"
-                    },
-                    "itemCode": {
-                        "type": "string",
-                        "description": "Item code to search for and equip (alternative to slotIndex, e.g., 'knife', 'axe')"
-                    },
-                    "hand": {
-                        "type": "string",
-                        "description": "Which hand to equip to: 'right' (default) or 'left'",
-                        "default": "right"
-                    }
+# Shared by every tool that targets a single block
+BLOCK_XYZ_PROPERTIES: dict[str, Any] = {
+    "x": {"type": "integer", "description": "Block X coordinate"},
+    "y": {"type": "integer", "description": "Block Y coordinate"},
+    "z": {"type": "integer", "description": "Block Z coordinate"},
+}
+
+# Tool definitions are static, so they are built once at import
+TOOLS: list[Tool] = [
+    Tool(
+        name="bot_status",
+        description="Get the current status of the VS API server and bot.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_spawn",
+        description="Spawn the AI bot at a specific position in the world.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "number", "description": "X coordinate"},
+                "y": {"type": "number", "description": "Y coordinate (vertical)"},
+                "z": {"type": "number", "description": "Z coordinate"}
+            },
+            "required": ["x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="bot_despawn",
+        description="Remove the AI bot from the world.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_observe",
+        description="Get detailed observation of the bot's current state including position, health, and surroundings.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_goto",
+        description="Command the bot to walk to a position using the game's built-in A* pathfinding (NavigateTo). Blocks until the bot reaches the destination or gets stuck. Works at long distances with the chunk loading fix. If stuck on terrain obstacles, try routing around them.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "number", "description": "Target X coordinate"},
+                "y": {"type": "number", "description": "Target Y coordinate (must be at ground level)"},
+                "z": {"type": "number", "description": "Target Z coordinate"},
+                "speed": {"type": "number", "description": "Movement speed (default: 0.03)", "default": 0.03},
+                "relative": {"type": "boolean", "description": "If true, coordinates are relative to current position", "default": False}
+            },
+            "required": ["x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="bot_stop",
+        description="Stop the bot's current movement.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_blocks",
+        description="Scan blocks around the bot in a given radius. Only returns surface blocks (visible with exposed face). Use filter to search for specific block types by keyword.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "radius": {"type": "integer", "description": "Scan radius in blocks (default: 3)", "default": 3},
+                "filter": {
+                    "type": "string",
+                    "description": "Keyword filter for block codes (case-insensitive). Use comma to match multiple keywords, e.g. 'flint,stone' matches blocks containing 'flint' OR 'stone'."
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_entities",
+        description="Get entities near the bot.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "radius": {"type": "number", "description": "Search radius (default: 10)", "default": 10}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_mine",
+        description="Mine a block using equipped tool. Respects tool tier - drops only if tool tier >= block requirement. Bot should have appropriate tool equipped (pickaxe for stone/ore, axe for wood, etc.). Tool tiers: 0=none, 1=stone/flint, 2=copper, 3=bronze, 4=iron, 5=steel.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **BLOCK_XYZ_PROPERTIES,
+                "relative": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "If true, coordinates are relative to bot position"
+                }
+            },
+            "required": ["x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="bot_place",
+        description="Place a block at the specified position.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **BLOCK_XYZ_PROPERTIES,
+                "blockCode": {"type": "string", "description": "Block code to place (e.g., 'game:stone')"}
+            },
+            "required": ["x", "y", "z", "blockCode"]
+        }
+    ),
+    Tool(
+        name="bot_interact",
+        description="Interact with a block (open/close doors, gates, trapdoors, activate levers, etc.). Simulates right-click on the block.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **BLOCK_XYZ_PROPERTIES,
+                "relative": {"type": "boolean", "description": "If true, coordinates are relative to bot position", "default": False}
+            },
+            "required": ["x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="players_list",
+        description="Get a list of all online players.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="player_observe",
+        description="Get detailed observation of a specific player.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Player name (case-insensitive)"}
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="bot_chat",
+        description="Send a chat message as the bot to all players in the game.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {"type": "string", "description": "The message to send"},
+                "name": {"type": "string", "description": f"Bot name to display (default: '{BOT_NAME}')", "default": BOT_NAME}
+            },
+            "required": ["message"]
+        }
+    ),
+    Tool(
+        name="bot_chat_location",
+        description=f"Send a chat message with a location, automatically converting absolute coordinates to relative coordinates (subtracts {WORLD_ORIGIN_OFFSET} from X and Z) so they match what players see on screen.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {"type": "string", "description": "Message prefix (e.g., 'Found copper at')"},
+                "x": {"type": "number", "description": "Absolute X coordinate"},
+                "y": {"type": "number", "description": "Y coordinate (unchanged)"},
+                "z": {"type": "number", "description": "Absolute Z coordinate"},
+                "name": {"type": "string", "description": f"Bot name to display (default: '{BOT_NAME}')", "default": BOT_NAME}
+            },
+            "required": ["message", "x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="screenshot",
+        description="Take a screenshot of the game.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_inventory",
+        description="Get the contents of the bot's inventory, including all slots and hand items.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_collect",
+        description="Pick up a loose surface item (flint, stones, sticks) at a specific position. Bot must be within 5 blocks of the target.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **BLOCK_XYZ_PROPERTIES
+            },
+            "required": ["x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="bot_inventory_drop",
+        description="Drop an item from the bot's inventory. Spawns the item in the world at the bot's feet.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "slotIndex": {"type": "integer", "description": "Inventory slot index to drop from (0-based)"},
+                "itemCode": {"type": "string", "description": "Item code to search for and drop (alternative to slotIndex)"},
+                "quantity": {"type": "integer", "description": "Number of items to drop (default: 1)", "default": 1}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_pickup",
+        description="Pick up a dropped item entity near the bot. If no entityId specified, picks up the nearest item.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entityId": {"type": "integer", "description": "Specific item entity ID to pick up (from bot_entities)"},
+                "maxDistance": {"type": "number", "description": "Maximum pickup distance (default: 5)", "default": 5}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_inbox",
+        description=f"Read messages sent to the bot by players. Players address the bot with '{BOT_NAME}: <message>' in chat.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "clear": {"type": "boolean", "description": "Clear inbox after reading (default: true)", "default": True},
+                "limit": {"type": "integer", "description": "Max messages to return (default: 50)", "default": 50}
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_knap",
+        description="Knap a flint or stone tool. Bot must have flint or stone in inventory. Creates knapping surface, completes recipe instantly, gives output to bot.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "recipe": {
+                    "type": "string",
+                    "description": "Tool to make: 'axe', 'knife', 'shovel', 'hoe', 'spear', or 'arrowhead'"
+                }
+            },
+            "required": ["recipe"]
+        }
+    ),
+    Tool(
+        name="bot_craft",
+        description="Craft an item using grid recipe. Bot must have all required ingredients in inventory. Use for combining knapped tool heads with sticks to make tools.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "recipe": {
+                    "type": "string",
+                    "description": "Output to craft (e.g., 'axe', 'knife', 'shovel', 'spear'). Matches recipes containing this name."
+                }
+            },
+            "required": ["recipe"]
+        }
+    ),
+    Tool(
+        name="bot_equip",
+        description="Equip an item from inventory to the bot's hand. Swaps with any item currently in hand.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "slotIndex": {
+                    "type": "integer",
+                    "description": "Inventory slot index to equip from (0-based)"
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="bot_use_tool",
-            description="Use equipped tool on a block (left-click action). Simulates attack/harvest actions like using a knife on grass to get dry grass, or using an axe to strip bark. Bot must have appropriate tool equipped.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "Block X coordinate"},
-                    "y": {"type": "integer", "description": "Block Y coordinate"},
-                    "z": {"type": "integer", "description": "Block Z coordinate"},
-                    "relative": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "If true, coordinates are relative to bot position"
-                    }
+                "itemCode": {
+                    "type": "string",
+                    "description": "Item code to search for and equip (alternative to slotIndex, e.g., 'knife', 'axe')"
                 },
-                "required": ["x", "y", "z"]
-            }
-        ),
-        Tool(
-            name="bot_attack",
-            description="Chase and attack a target entity with equipped melee weapon. Bot will pursue the target and attack until it dies or escapes. Use bot_entities first to find target IDs.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entityId": {
-                        "type": "integer",
-                        "description": "Target entity ID (from bot_entities)"
-                    },
-                    "maxChaseDistance": {
-                        "type": "number",
-                        "default": 30,
-                        "description": "Give up if target gets this far away (default: 30)"
-                    }
+                "hand": {
+                    "type": "string",
+                    "description": "Which hand to equip to: 'right' (default) or 'left'",
+                    "default": "right"
+                }
+            },
+            "required": []
+        }
+    ),
+    Tool(
+        name="bot_use_tool",
+        description="Use equipped tool on a block (left-click action). Simulates attack/harvest actions like using a knife on grass to get dry grass, or using an axe to strip bark. Bot must have appropriate tool equipped.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **BLOCK_XYZ_PROPERTIES,
+                "relative": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "If true, coordinates are relative to bot position"
+                }
+            },
+            "required": ["x", "y", "z"]
+        }
+    ),
+    Tool(
+        name="bot_attack",
+        description="Chase and attack a target entity with equipped melee weapon. Bot will pursue the target and attack until it dies or escapes. Use bot_entities first to find target IDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entityId": {
+                    "type": "integer",
+                    "description": "Target entity ID (from bot_entities)"
                 },
-                "required": ["entityId"]
-            }
-        ),
-        Tool(
-            name="bot_harvest",
-            description="Harvest a dead animal corpse to get meat, hides, and other drops. Bot must have a knife equipped and be within 5 blocks of the corpse. Use bot_entities first to find dead animals (alive=false). Drop rate is 40% since bot is not a player.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entityId": {
-                        "type": "integer",
-                        "description": "Entity ID of the dead animal to harvest (from bot_entities)"
+                "maxChaseDistance": {
+                    "type": "number",
+                    "default": 30,
+                    "description": "Give up if target gets this far away (default: 30)"
+                }
+            },
+            "required": ["entityId"]
+        }
+    ),
+    Tool(
+        name="bot_harvest",
+        description="Harvest a dead animal corpse to get meat, hides, and other drops. Bot must have a knife equipped and be within 5 blocks of the corpse. Use bot_entities first to find dead animals (alive=false). Drop rate is 40% since bot is not a player.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entityId": {
+                    "type": "integer",
+                    "description": "Entity ID of the dead animal to harvest (from bot_entities)"
+                }
+            },
+            "required": ["entityId"]
+        }
+    ),
+    Tool(
+        name="bot_batch",
+        description="Run several independent tool calls concurrently and return their results in order. Use for bursts of quick lookups or actions that don't depend on each other (e.g. bot_inventory + bot_entities + bot_blocks). Calls run at the same time, so don't batch steps that must happen in sequence.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Tool name (any tool except bot_batch)"},
+                            "arguments": {"type": "object", "description": "Arguments for the tool (default: {})"}
+                        },
+                        "required": ["name"]
                     }
-                },
-                "required": ["entityId"]
-            }
-        )
-    ]
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+]
 
+# Required argument names per tool, read once from the input schemas
+REQUIRED_ARGS: dict[str, tuple[str, ...]] = {
+    tool.name: tuple(tool.inputSchema.get("required", ())) for tool in TOOLS
+}
 
-# Tools that have blocking wait loops and need to run in a thread
-BLOCKING_TOOLS = {"bot_goto", "bot_attack"}
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools."""
+    return TOOLS
+
+
+def to_json_text(result: dict[str, Any]) -> str:
+    """JSON text for tool results (compact unless VSAI_PRETTY_JSON is set)."""
+    return orjson.dumps(result, option=RESULT_JSON_OPTIONS).decode()
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
-        # Run blocking tools in a background thread so MCP server stays responsive
-        if name in BLOCKING_TOOLS:
-            result = await asyncio.to_thread(execute_tool, name, arguments)
-        else:
-            result = execute_tool(name, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-    except URLError as e:
-        error_result = {"error": f"Failed to connect to VS server: {e}"}
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+        result = await execute_tool(name, arguments)
     except Exception as e:
-        error_result = {"error": str(e)}
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+        result = error_result(e)
+    return [TextContent(type="text", text=to_json_text(result))]
 
 
-def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-    """Execute a tool and return the result."""
+def error_result(e: Exception) -> dict[str, Any]:
+    """Tool result for a failed call."""
+    if isinstance(e, httpx.TransportError):
+        return {"error": f"Failed to connect to VS server: {e}"}
+    return {"error": str(e)}
 
-    if name == "bot_status":
-        return http_get("/status")
-
-    elif name == "bot_spawn":
-        return http_post("/bot/spawn", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"]
-        })
-
-    elif name == "bot_despawn":
-        return http_post("/bot/despawn", {})
-
-    elif name == "bot_observe":
-        return http_get("/bot/observe")
-
-    elif name == "bot_goto":
-        # Get initial position for reporting
-        initial_status = http_get("/bot/movement/status")
-        if "error" in initial_status:
-            return initial_status
-
-        start_pos = Position(
-            initial_status["position"]["x"],
-            initial_status["position"]["y"],
-            initial_status["position"]["z"]
-        )
-
-        # Issue goto command
-        goto_result = http_post("/bot/goto", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"],
-            "speed": arguments.get("speed", 0.03),
-            "relative": arguments.get("relative", False)
-        })
-
-        if "error" in goto_result:
-            return goto_result
-
-        # Calculate actual target
-        if arguments.get("relative", False):
-            target = Position(
-                start_pos.x + arguments["x"],
-                start_pos.y + arguments["y"],
-                start_pos.z + arguments["z"]
-            )
-        else:
-            target = Position(arguments["x"], arguments["y"], arguments["z"])
-
-        # Wait for movement to complete
-        final_status = wait_for_movement_complete()
-
-        if "error" in final_status:
-            # Include current position for interrupted/error states
-            pos = final_status.get("position", {})
-            end_pos = Position(pos.get("x", 0), pos.get("y", 0), pos.get("z", 0))
-
-            result = {
-                "success": False,
-                "status": final_status.get("status"),
-                "statusMessage": final_status.get("statusMessage"),
-                "error": final_status.get("error"),
-                "startPosition": {"x": start_pos.x, "y": start_pos.y, "z": start_pos.z},
-                "endPosition": {"x": end_pos.x, "y": end_pos.y, "z": end_pos.z},
-                "targetPosition": {"x": target.x, "y": target.y, "z": target.z},
-                "distanceToTarget": end_pos.distance_to(target)
-            }
 
-            # Include interrupt details if present
-            if "interruptDetails" in final_status:
-                result["interruptDetails"] = final_status["interruptDetails"]
+# Fetches x, y, z from tool arguments in one C-level call
+get_xyz = itemgetter("x", "y", "z")
 
-            return result
 
-        end_pos = Position(
-            final_status["position"]["x"],
-            final_status["position"]["y"],
-            final_status["position"]["z"]
-        )
-
-        success = final_status.get("status") == "reached"
-
-        return {
-            "success": success,
-            "status": final_status.get("status"),
-            "statusMessage": final_status.get("statusMessage"),
-            "startPosition": {"x": start_pos.x, "y": start_pos.y, "z": start_pos.z},
-            "endPosition": {"x": end_pos.x, "y": end_pos.y, "z": end_pos.z},
-            "targetPosition": {"x": target.x, "y": target.y, "z": target.z},
-            "distanceToTarget": end_pos.distance_to(target)
-        }
+async def handle_bot_goto(arguments: dict[str, Any]) -> dict[str, Any]:
+    x, y, z = get_xyz(arguments)
+    relative = arguments.get("relative", False)
+
+    # Get initial position for reporting
+    initial_status = await http_get("/bot/movement/status")
+    if "error" in initial_status:
+        return initial_status
+
+    start_pos = Position(
+        initial_status["position"]["x"],
+        initial_status["position"]["y"],
+        initial_status["position"]["z"]
+    )
 
-    elif name == "bot_stop":
-        return http_post("/bot/stop", {})
+    # Issue goto command
+    goto_result = await http_post("/bot/goto", {
+        "x": x,
+        "y": y,
+        "z": z,
+        "speed": arguments.get("speed", 0.03),
+        "relative": relative
+    })
 
-    elif name == "bot_blocks":
-        radius = arguments.get("radius", 3)
-        keyword_filter = arguments.get("filter", None)
+    if "error" in goto_result:
+        return goto_result
 
+    # Calculate actual target
+    if relative:
+        target = Position(start_pos.x + x, start_pos.y + y, start_pos.z + z)
+    else:
+        target = Position(x, y, z)
+
+    # Wait for movement to complete
+    final_status = await wait_for_movement_complete()
+
+    if "error" in final_status:
+        # Include current position for interrupted/error states
+        pos = final_status.get("position", {})
+        end_pos = Position(pos.get("x", 0), pos.get("y", 0), pos.get("z", 0))
+        return goto_result_dict(final_status, False, start_pos, end_pos, target, error=True)
+
+    end_pos = Position(
+        final_status["position"]["x"],
+        final_status["position"]["y"],
+        final_status["position"]["z"]
+    )
+
+    success = final_status.get("status") == "reached"
+    return goto_result_dict(final_status, success, start_pos, end_pos, target)
+
+
+def goto_result_dict(
+    final_status: dict[str, Any],
+    success: bool,
+    start_pos: Position,
+    end_pos: Position,
+    target: Position,
+    error: bool = False
+) -> dict[str, Any]:
+    """bot_goto result shared by the success and error paths."""
+    result: dict[str, Any] = {
+        "success": success,
+        "status": final_status.get("status"),
+        "statusMessage": final_status.get("statusMessage"),
+    }
+    if error:
+        result["error"] = final_status.get("error")
+    result["startPosition"] = start_pos.to_dict()
+    result["endPosition"] = end_pos.to_dict()
+    result["targetPosition"] = target.to_dict()
+    result["distanceToTarget"] = end_pos.distance_to(target)
+
+    # Include interrupt details if present
+    if error and "interruptDetails" in final_status:
+        result["interruptDetails"] = final_status["interruptDetails"]
+
+    return result
+
+
+def blocks_cache_key(position: dict[str, float], radius: int) -> tuple[int, int, int, int]:
+    """Visibility passes are reused per (block the bot stands in, radius)."""
+    return (math.floor(position["x"]), math.floor(position["y"]), math.floor(position["z"]), radius)
+
+
+@lru_cache(maxsize=64)
+def keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Case-insensitive matcher for any of the keywords; agents repeat the same few filters."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def known_bot_position() -> dict[str, float] | None:
+    """Bot position from a fresh observation or a scan within BLOCKS_CACHE_TTL_SEC, else None."""
+    observation = fresh_observation()
+    if observation is not None:
+        return observation["bot"]["position"]
+    if last_scan_position is not None and time.monotonic() - last_scan_position[0] < BLOCKS_CACHE_TTL_SEC:
+        return last_scan_position[1]
+    return None
+
+
+async def handle_bot_blocks(arguments: dict[str, Any]) -> dict[str, Any]:
+    global last_scan_position
+    radius = arguments.get("radius", 3)
+    keyword_filter = arguments.get("filter", None)
+
+    # A recently known position gives the cache key without a request
+    cached = None
+    observer_pos = known_bot_position()
+    if observer_pos is not None:
+        cached = blocks_cache.get(blocks_cache_key(observer_pos, radius))
+
+    if cached is not None and time.monotonic() - cached[0] < BLOCKS_CACHE_TTL_SEC:
+        _, total_scanned, filtered = cached
+    else:
         # Get raw blocks from API
-        result = http_get(f"/bot/blocks?radius={radius}")
+        result = await http_get(f"/bot/blocks?radius={radius}")
 
         if "error" in result:
             return result
 
-        # Get bot position for visibility calculation
-        bot_obs = http_get("/bot/observe")
-        if "error" in bot_obs:
-            return result  # Fall back to unfiltered if can't get position
+        # The scan reports the bot's exact position; older mods only send the block position
+        observer_pos = result.get("botPosition")
+        if observer_pos is None:
+            bot_obs = await cached_observe()
+            if "error" in bot_obs:
+                # Fall back to unfiltered if can't get position
+                return result
+            observer_pos = bot_obs["bot"]["position"]
+        last_scan_position = (time.monotonic(), observer_pos)
 
-        observer_pos = bot_obs["bot"]["position"]
         blocks = result.get("blocks", [])
+        total_scanned = len(blocks)
 
         # Apply surface visibility filtering (always enabled)
-        filtered = get_visible_surface_blocks(observer_pos, blocks)
-
-        # Apply keyword filtering if specified
-        if keyword_filter:
-            keywords = [kw.strip().lower() for kw in keyword_filter.split(",")]
-            filtered = [
-                block for block in filtered
-                if any(kw in block.get("code", "").lower() for kw in keywords)
-            ]
-
-        return {
-            "success": True,
-            "botPosition": observer_pos,
-            "radius": radius,
-            "visibilityFilter": "surface",
-            "keywordFilter": keyword_filter,
-            "totalBlocksScanned": len(blocks),
-            "visibleBlockCount": len(filtered),
-            "blocks": filtered
-        }
+        filtered = get_visible_surface_blocks(get_xyz(observer_pos), blocks)
+
+        cache_key = blocks_cache_key(observer_pos, radius)
+        blocks_cache[cache_key] = (time.monotonic(), total_scanned, filtered)
+        blocks_cache.move_to_end(cache_key)
+        if len(blocks_cache) > BLOCKS_CACHE_MAX_ENTRIES:
+            blocks_cache.popitem(last=False)
+
+    # Apply keyword filtering if specified
+    if keyword_filter:
+        # One case-insensitive regex scan per block instead of K lowercased substring checks
+        pattern = keyword_pattern(tuple(kw.strip() for kw in keyword_filter.split(",")))
+        filtered = [block for block in filtered if pattern.search(block.get("code", ""))]
+
+    return {
+        "success": True,
+        "botPosition": observer_pos,
+        "radius": radius,
+        "visibilityFilter": "surface",
+        "keywordFilter": keyword_filter,
+        "totalBlocksScanned": total_scanned,
+        "visibleBlockCount": len(filtered),
+        "blocks": filtered
+    }
+
+
+async def handle_bot_chat_location(arguments: dict[str, Any]) -> dict[str, Any]:
+    # Convert absolute coordinates to relative (subtract the world origin offset from X and Z)
+    x, y, z = get_xyz(arguments)
+    rel_x = int(x - WORLD_ORIGIN_OFFSET)
+    rel_z = int(z - WORLD_ORIGIN_OFFSET)
+    y = int(y)
+
+    # Format message with relative coordinates
+    full_message = f"{arguments['message']} ({rel_x}, {y}, {rel_z})"
+
+    return await http_post("/bot/chat", {
+        "message": full_message,
+        "name": arguments.get("name", BOT_NAME)
+    })
+
+
+async def handle_bot_inbox(arguments: dict[str, Any]) -> dict[str, Any]:
+    clear = arguments.get("clear", True)
+    limit = arguments.get("limit", 50)
+    params = f"?limit={limit}&clear={'true' if clear else 'false'}"
+    return await http_get(f"/bot/inbox{params}")
+
+
+async def handle_bot_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+    calls = arguments["calls"]
+    results = await asyncio.gather(
+        *(execute_batched_call(call) for call in calls),
+        return_exceptions=True
+    )
+    return {
+        "results": [
+            {
+                "name": call.get("name") if isinstance(call, dict) else None,
+                "result": error_result(r) if isinstance(r, Exception) else r
+            }
+            for call, r in zip(calls, results)
+        ]
+    }
+
+
+async def execute_batched_call(call: Any) -> dict[str, Any]:
+    # Entries are rejected one by one so a malformed call never fails the whole batch
+    if not isinstance(call, dict):
+        return {"error": "batch entry must be an object"}
+    name = call.get("name")
+    if not isinstance(name, str):
+        return {"error": "batch entry needs a string name"}
+    if name == "bot_batch":
+        return {"error": "bot_batch cannot be nested"}
+    arguments = call.get("arguments", {})
+    if not isinstance(arguments, dict):
+        return {"error": "batch entry arguments must be an object"}
+    return await execute_tool(name, arguments)
+
+
+# Marks an optional argument that is only forwarded when the caller supplied it
+OMIT = object()
+
+
+class PostToolSpec(NamedTuple):
+    """A tool that forwards its arguments as a single POST."""
+    path: str
+    required: tuple[str, ...]
+    optional: tuple[tuple[str, Any], ...]  # (key, default) pairs; OMIT drops the key when absent
+    timeout: httpx.Timeout
+
+
+POST_TOOL_SPECS: dict[str, PostToolSpec] = {
+    "bot_spawn": PostToolSpec("/bot/spawn", ("x", "y", "z"), (), REQUEST_TIMEOUT),
+    "bot_despawn": PostToolSpec("/bot/despawn", (), (), REQUEST_TIMEOUT),
+    "bot_stop": PostToolSpec("/bot/stop", (), (), REQUEST_TIMEOUT),
+    "bot_mine": PostToolSpec("/bot/mine", ("x", "y", "z"), (("relative", False),), REQUEST_TIMEOUT),
+    "bot_place": PostToolSpec("/bot/place", ("x", "y", "z", "blockCode"), (), REQUEST_TIMEOUT),
+    "bot_interact": PostToolSpec("/bot/interact", ("x", "y", "z"), (("relative", False),), REQUEST_TIMEOUT),
+    "bot_chat": PostToolSpec("/bot/chat", ("message",), (("name", BOT_NAME),), REQUEST_TIMEOUT),
+    "screenshot": PostToolSpec("/screenshot", (), (), REQUEST_TIMEOUT),
+    "bot_collect": PostToolSpec("/bot/collect", ("x", "y", "z"), (), REQUEST_TIMEOUT),
+    "bot_inventory_drop": PostToolSpec("/bot/inventory/drop", (), (("slotIndex", OMIT), ("itemCode", OMIT), ("quantity", OMIT)), REQUEST_TIMEOUT),
+    "bot_pickup": PostToolSpec("/bot/pickup", (), (("entityId", OMIT), ("maxDistance", OMIT)), REQUEST_TIMEOUT),
+    "bot_equip": PostToolSpec("/bot/equip", (), (("slotIndex", OMIT), ("itemCode", OMIT), ("hand", OMIT)), REQUEST_TIMEOUT),
+    "bot_use_tool": PostToolSpec("/bot/use_tool", ("x", "y", "z"), (("relative", False),), REQUEST_TIMEOUT),
+    # Longer timeout for combat operations
+    "bot_attack": PostToolSpec("/bot/attack", ("entityId",), (("maxChaseDistance", 30),), COMBAT_TIMEOUT),
+    "bot_harvest": PostToolSpec("/bot/harvest", ("entityId",), (), REQUEST_TIMEOUT),
+}
+
+
+@lru_cache(maxsize=256)
+def recipe_body(recipe: str) -> bytes:
+    """Encoded {"recipe": ...} body; sessions knap and craft the same few recipes repeatedly."""
+    return orjson.dumps({"recipe": recipe})
+
+
+def post_tool_handler(spec: PostToolSpec) -> Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]:
+    """Handler that POSTs the allow-listed arguments of a POST_TOOL_SPECS entry."""
+    path, required, optional, timeout = spec
+
+    def handler(arguments: dict[str, Any]) -> Awaitable[dict[str, Any]]:
+        data = {key: arguments[key] for key in required}
+        for key, default in optional:
+            value = arguments.get(key, default)
+            if value is not OMIT:
+                data[key] = value
+        return http_post(path, data, timeout=timeout)
+    return handler
+
+
+# Tool name -> coroutine handler, built once at import so dispatch is a single dict lookup.
+# The lambdas return the http_get/http_post coroutine for execute_tool to await.
+TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+    "bot_status": lambda a: http_get("/status"),
+    "bot_observe": lambda a: http_get("/bot/observe"),
+    "bot_goto": handle_bot_goto,
+    "bot_blocks": handle_bot_blocks,
+    "bot_entities": lambda a: http_get(f"/bot/entities?radius={a.get('radius', 10)}"),
+    "players_list": lambda a: http_get("/players"),
+    "player_observe": lambda a: http_get(f"/player/{a['name']}/observe"),
+    "bot_chat_location": handle_bot_chat_location,
+    "bot_inbox": handle_bot_inbox,
+    "bot_inventory": lambda a: http_get("/bot/inventory"),
+    "bot_batch": handle_bot_batch,
+    "bot_knap": lambda a: http_post_raw("/bot/knap", recipe_body(a["recipe"])),
+    "bot_craft": lambda a: http_post_raw("/bot/craft", recipe_body(a["recipe"])),
+    **{name: post_tool_handler(spec) for name, spec in POST_TOOL_SPECS.items()},
+}
+
+
+async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Execute a tool and return the result."""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return {"error": f"Unknown tool: {name}"}
+    missing = [key for key in REQUIRED_ARGS[name] if key not in arguments]
+    if missing:
+        return {"error": "invalid arguments", "detail": f"missing required: {', '.join(missing)}"}
+    return await handler(arguments)
 
-    elif name == "bot_entities":
-        radius = arguments.get("radius", 10)
-        return http_get(f"/bot/entities?radius={radius}")
-
-    elif name == "bot_mine":
-        return http_post("/bot/mine", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"],
-            "relative": arguments.get("relative", False)
-        })
-
-    elif name == "bot_place":
-        return http_post("/bot/place", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"],
-            "blockCode": arguments["blockCode"]
-        })
-
-    elif name == "bot_interact":
-        return http_post("/bot/interact", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"],
-            "relative": arguments.get("relative", False)
-        })
-
-    elif name == "players_list":
-        return http_get("/players")
-
-    elif name == "player_observe":
-        player_name = arguments["name"]
-        return http_get(f"/player/{player_name}/observe")
-
-    elif name == "bot_chat":
-        return http_post("/bot/chat", {
-            "message": arguments["message"],
-            "name": arguments.get("name", BOT_NAME)
-        })
-
-    elif name == "bot_chat_location":
-        # Convert absolute coordinates to relative (subtract 512000 from X and Z)
-        rel_x = int(arguments["x"] - 512000)
-        rel_z = int(arguments["z"] - 512000)
-        y = int(arguments["y"])
-
-        # Format message with relative coordinates
-        full_message = f"{arguments['message']} ({rel_x}, {y}, {rel_z})"
-
-        return http_post("/bot/chat", {
-            "message": full_message,
-            "name": arguments.get("name", BOT_NAME)
-        })
-
-    elif name == "bot_inbox":
-        clear = arguments.get("clear", True)
-        limit = arguments.get("limit", 50)
-        params = f"?limit={limit}&clear={'true' if clear else 'false'}"
-        return http_get(f"/bot/inbox{params}")
-
-    elif name == "screenshot":
-        return http_post("/screenshot", {})
-
-    elif name == "bot_inventory":
-        return http_get("/bot/inventory")
-
-    elif name == "bot_collect":
-        return http_post("/bot/collect", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"]
-        })
-
-    elif name == "bot_inventory_drop":
-        data: dict[str, Any] = {}
-        if "slotIndex" in arguments:
-            data["slotIndex"] = arguments["slotIndex"]
-        if "itemCode" in arguments:
-            data["itemCode"] = arguments["itemCode"]
-        if "quantity" in arguments:
-            data["quantity"] = arguments["quantity"]
-        return http_post("/bot/inventory/drop", data)
-
-    elif name == "bot_pickup":
-        data: dict[str, Any] = {}
-        if "entityId" in arguments:
-            data["entityId"] = arguments["entityId"]
-        if "maxDistance" in arguments:
-            data["maxDistance"] = arguments["maxDistance"]
-        return http_post("/bot/pickup", data)
-
-    elif name == "bot_knap":
-        return http_post("/bot/knap", {
-            "recipe": arguments["recipe"]
-        })
-
-    elif name == "bot_craft":
-        return http_post("/bot/craft", {
-            "recipe": arguments["recipe"]
-        })
-
-    elif name == "bot_equip":
-        data: dict[str, Any] = {}
-        if "slotIndex" in arguments:
-            data["slotIndex"] = arguments["slotIndex"]
-        if "itemCode" in arguments:
-            data["itemCode"] = arguments["itemCode"]
-        if "hand" in arguments:
-            data["hand"] = arguments["hand"]
-        return http_post("/bot/equip", data)
-
-    elif name == "bot_use_tool":
-        return http_post("/bot/use_tool", {
-            "x": arguments["x"],
-            "y": arguments["y"],
-            "z": arguments["z"],
-            "relative": arguments.get("relative", False)
-        })
-
-    elif name == "bot_attack":
-        # Longer timeout for combat operations (60 second combat + buffer)
-        return http_post("/bot/attack", {
-            "entityId": arguments["entityId"],
-            "maxChaseDistance": arguments.get("maxChaseDistance", 30)
-        }, timeout=65)
-
-    elif name == "bot_harvest":
-        return http_post("/bot/harvest", {
-            "entityId": arguments["entityId"]
-        })
 
-    else:
-        return {"error": f"Unknown tool: {name}"}
+async def prewarm_connection() -> None:
+    """Open a keep-alive connection to the VS server so the first tool call skips the handshake."""
+    try:
+        await http_client.head("/status")
+    except httpx.TransportError:
+        pass  # Server not up yet; the first tool call will connect
 
 
 async def main() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    await prewarm_connection()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await http_client.aclose()
 
 
 def run() -> None:
     """Entry point for running the MCP server."""
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional: libuv event loop, not available on Windows
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 if __name__ == "__main__":
@@ -39,10 +39,16 @@ public class VsaiModSystem : ModSystem
     private const int ChunkLoadRadius = 3;  // Load 7x7 chunks (3 in each direction from center)
     private const int ChunkSize = 32;  // VS chunk size in blocks
 
+    // Long-poll bounds for /bot/movement/status?waitChange=...&etag=...
+    private const int MaxMovementWaitMs = 30000;
+    private const int MovementWaitStepMs = 50;
+
     // Chat inbox for player messages
     private string _botName = "Claude";
     private readonly Queue<ChatMessage> _chatInbox = new Queue<ChatMessage>();
     private const int MaxInboxSize = 100;
+    // Message count header on inbox reads, lets pollers skip parsing empty responses
+    private const string InboxCountHeader = "X-Inbox-Count";
     private readonly object _inboxLock = new object();
 
     private class ChatMessage
@@ -287,6 +293,13 @@ public class VsaiModSystem : ModSystem
             var path = request.Url?.AbsolutePath ?? "/";
             var method = request.HttpMethod;
 
+            // Lightweight liveness probe: HEAD /status answers without building the status payload
+            if (method == "HEAD" && (path == "/" || path == "/status"))
+            {
+                response.StatusCode = 200;
+                return;
+            }
+
             switch (path)
             {
                 case "/":
@@ -433,7 +446,7 @@ public class VsaiModSystem : ModSystem
                     break;
 
                 case "/bot/movement/status":
-                    responseBody = HandleBotMovementStatus();
+                    responseBody = HandleBotMovementStatus(request, response);
                     break;
 
                 case "/bot/chat":
@@ -501,7 +514,11 @@ public class VsaiModSystem : ModSystem
                     break;
 
                 case "/bot/inbox":
-                    responseBody = HandleBotInbox(request);
+                    responseBody = HandleBotInbox(request, response);
+                    break;
+
+                case "/bot/poll":
+                    responseBody = HandleBotPoll(request, response);
                     break;
 
                 case "/bot/knap":
@@ -594,6 +611,11 @@ public class VsaiModSystem : ModSystem
     }
 
     private string HandleStatus()
+    {
+        return JsonSerializer.Serialize(BuildStatus());
+    }
+
+    private object BuildStatus()
     {
         var players = _serverApi?.World?.AllOnlinePlayers ?? Array.Empty<IPlayer>();
         bool botActive = _botEntity != null && _botEntity.Alive;
@@ -604,7 +626,7 @@ public class VsaiModSystem : ModSystem
             pendingMessages = _chatInbox.Count;
         }
 
-        return JsonSerializer.Serialize(new
+        return new
         {
             status = "ok",
             mod = "vsai",
@@ -621,7 +643,7 @@ public class VsaiModSystem : ModSystem
             {
                 pendingCount = pendingMessages
             }
-        });
+        };
     }
 
     private string HandlePlayers()
@@ -1015,7 +1037,16 @@ public class VsaiModSystem : ModSystem
             return JsonError("No active bot. Spawn one first with POST /bot/spawn");
         }
 
-        var pos = _botEntity.ServerPos;
+        return JsonSerializer.Serialize(new { bot = BuildBotObservation() });
+    }
+
+    /// <summary>
+    /// Bot observation payload shared by /bot/observe and /bot/movement/status?include=observe.
+    /// Caller must ensure the bot is alive.
+    /// </summary>
+    private object BuildBotObservation()
+    {
+        var pos = _botEntity!.ServerPos;
 
         // Diagnostic: check if entity is actually in the world's LoadedEntities
         bool inLoadedEntities = _serverApi?.World.LoadedEntities.ContainsKey(_botEntityId) ?? false;
@@ -1034,22 +1065,19 @@ public class VsaiModSystem : ModSystem
             }
         }
 
-        return JsonSerializer.Serialize(new
+        return new
         {
-            bot = new
-            {
-                entityId = _botEntityId,
-                position = new { x = pos.X, y = pos.Y, z = pos.Z },
-                rotation = new { yaw = pos.Yaw, pitch = pos.Pitch },
-                alive = _botEntity.Alive,
-                health = currentHealth,
-                maxHealth = maxHealth,
-                onGround = _botEntity.OnGround,
-                inWater = _botEntity.Swimming,
-                inLoadedEntities = inLoadedEntities,
-                state = entityState
-            }
-        });
+            entityId = _botEntityId,
+            position = new { x = pos.X, y = pos.Y, z = pos.Z },
+            rotation = new { yaw = pos.Yaw, pitch = pos.Pitch },
+            alive = _botEntity.Alive,
+            health = currentHealth,
+            maxHealth = maxHealth,
+            onGround = _botEntity.OnGround,
+            inWater = _botEntity.Swimming,
+            inLoadedEntities = inLoadedEntities,
+            state = entityState
+        };
     }
 
     private string HandleBotObserveBlocks(HttpListenerRequest request)
@@ -1098,9 +1126,13 @@ public class VsaiModSystem : ModSystem
             }
         }
 
+        // Exact position too, so visibility callers don't need a separate /bot/observe
+        var exactPos = _botEntity.ServerPos;
+
         return JsonSerializer.Serialize(new
         {
             botPos = new { x = pos.X, y = pos.Y, z = pos.Z },
+            botPosition = new { x = exactPos.X, y = exactPos.Y, z = exactPos.Z },
             radius = radius,
             blockCount = blocks.Count,
             blocks = blocks
@@ -2522,14 +2554,60 @@ public class VsaiModSystem : ModSystem
         });
     }
 
-    private string HandleBotMovementStatus()
+    /// <summary>
+    /// Movement status. With ?include=observe the response is
+    /// { movement, bot } so movement pollers get the observation in the same request.
+    /// Passing waitChange (milliseconds) and the etag of a previous response long-polls:
+    /// the request blocks until the movement state changes or the wait elapses.
+    /// </summary>
+    private string HandleBotMovementStatus(HttpListenerRequest request, HttpListenerResponse response)
     {
         if (_botEntity == null || !_botEntity.Alive)
         {
             return JsonError("No active bot");
         }
 
-        var pos = _botEntity.ServerPos;
+        string etag = MovementSignature();
+        string? lastEtag = request.QueryString["etag"];
+        if (!string.IsNullOrEmpty(lastEtag) && int.TryParse(request.QueryString["waitChange"], out int waitMs))
+        {
+            long deadline = Environment.TickCount64 + Math.Clamp(waitMs, 0, MaxMovementWaitMs);
+            while (etag == lastEtag && Environment.TickCount64 < deadline)
+            {
+                Thread.Sleep(MovementWaitStepMs);
+                if (_botEntity == null || !_botEntity.Alive)
+                {
+                    return JsonError("No active bot");
+                }
+                etag = MovementSignature();
+            }
+        }
+        response.AddHeader("ETag", etag);
+
+        var movement = BuildMovementStatus();
+        if (request.QueryString["include"] == "observe")
+        {
+            return JsonSerializer.Serialize(new { movement, bot = BuildBotObservation() });
+        }
+        return JsonSerializer.Serialize(movement);
+    }
+
+    /// <summary>
+    /// Fingerprint of the movement fields pollers react to (not position, which
+    /// changes every tick while walking). Caller must ensure the bot is alive.
+    /// </summary>
+    private string MovementSignature()
+    {
+        var task = GetRemoteControlTask();
+        bool interrupted = _botEntity is EntityAiBot aiBot && aiBot.GetInterrupt() != null;
+        bool inLoadedEntities = _serverApi?.World.LoadedEntities.ContainsKey(_botEntityId) ?? false;
+        string signature = $"{task?.GetStatus()}|{task?.GetStatusMessage()}|{task?.IsActive()}|{interrupted}|{_botEntity!.State}|{inLoadedEntities}";
+        return ((uint)signature.GetHashCode()).ToString("x8");
+    }
+
+    private object BuildMovementStatus()
+    {
+        var pos = _botEntity!.ServerPos;
         var task = GetRemoteControlTask();
 
         // Check for combat interrupt (peek, don't consume - interrupt persists until new movement)
@@ -2545,7 +2623,7 @@ public class VsaiModSystem : ModSystem
 
         if (task == null)
         {
-            return JsonSerializer.Serialize(new
+            return new
             {
                 success = true,
                 status = "no_task",
@@ -2561,12 +2639,12 @@ public class VsaiModSystem : ModSystem
                     currentHealth = interrupt.CurrentHealth,
                     maxHealth = interrupt.MaxHealth
                 } : null
-            });
+            };
         }
 
         var lastTarget = task.GetLastTarget();
 
-        return JsonSerializer.Serialize(new
+        return new
         {
             success = true,
             status = task.GetStatus(),
@@ -2585,7 +2663,7 @@ public class VsaiModSystem : ModSystem
                 currentHealth = interrupt.CurrentHealth,
                 maxHealth = interrupt.MaxHealth
             } : null
-        });
+        };
     }
 
     private string HandleBotChat(HttpListenerRequest request)
@@ -2593,7 +2671,7 @@ public class VsaiModSystem : ModSystem
         var body = ReadRequestBody(request);
         if (string.IsNullOrEmpty(body))
         {
-            return JsonError("Empty request body. Provide 'message' field.");
+            return JsonError("Empty request body. Provide 'message' or 'messages' field.");
         }
 
         try
@@ -2601,6 +2679,35 @@ public class VsaiModSystem : ModSystem
             using var doc = JsonDocument.Parse(body);
             var root = doc.RootElement;
 
+            // Optional bot name prefix (default: _botName)
+            string botName = _botName;
+            if (root.TryGetProperty("name", out var nameEl))
+            {
+                botName = nameEl.GetString() ?? _botName;
+            }
+
+            // Batched form: {"messages": ["...", "..."]} - broadcast each in order
+            if (root.TryGetProperty("messages", out var messagesEl) && messagesEl.ValueKind == JsonValueKind.Array)
+            {
+                var sent = new List<string>();
+                foreach (var el in messagesEl.EnumerateArray())
+                {
+                    string text = el.GetString() ?? "";
+                    if (!string.IsNullOrEmpty(text))
+                    {
+                        BroadcastBotChat(botName, text);
+                        sent.Add(text);
+                    }
+                }
+
+                return JsonSerializer.Serialize(new
+                {
+                    success = true,
+                    messageCount = sent.Count,
+                    botName = botName
+                });
+            }
+
             if (!root.TryGetProperty("message", out var messageEl))
             {
                 return JsonError("Missing 'message' field");
@@ -2612,20 +2719,7 @@ public class VsaiModSystem : ModSystem
                 return JsonError("Message cannot be empty");
             }
 
-            // Optional bot name prefix (default: _botName)
-            string botName = _botName;
-            if (root.TryGetProperty("name", out var nameEl))
-            {
-                botName = nameEl.GetString() ?? _botName;
-            }
-
-            // Format the message with bot name in color
-            string formattedMessage = $"<font color=\"#00ddff\" weight=\"bold\">[{botName}]</font> {message}";
-
-            // Broadcast to all players
-            _serverApi?.BroadcastMessageToAllGroups(formattedMessage, EnumChatType.OthersMessage);
-
-            _serverApi?.Logger.Debug($"[VSAI] Bot chat: {message}");
+            BroadcastBotChat(botName, message);
 
             return JsonSerializer.Serialize(new
             {
@@ -2640,6 +2734,17 @@ public class VsaiModSystem : ModSystem
         }
     }
 
+    private void BroadcastBotChat(string botName, string message)
+    {
+        // Format the message with bot name in color
+        string formattedMessage = $"<font color=\"#00ddff\" weight=\"bold\">[{botName}]</font> {message}";
+
+        // Broadcast to all players
+        _serverApi?.BroadcastMessageToAllGroups(formattedMessage, EnumChatType.OthersMessage);
+
+        _serverApi?.Logger.Debug($"[VSAI] Bot chat: {message}");
+    }
+
     private string HandleBotInventory()
     {
         if (_botEntity == null || !_botEntity.Alive)
@@ -3205,7 +3310,49 @@ public class VsaiModSystem : ModSystem
         });
     }
 
-    private string HandleBotInbox(HttpListenerRequest request)
+    private string HandleBotInbox(HttpListenerRequest request, HttpListenerResponse response)
+    {
+        var messages = ReadInbox(request);
+        response.AddHeader(InboxCountHeader, messages.Count.ToString());
+
+        return JsonSerializer.Serialize(new
+        {
+            success = true,
+            botName = _botName,
+            messageCount = messages.Count,
+            messages = messages
+        });
+    }
+
+    /// <summary>
+    /// Inbox read for pollers, with the server status only on ?include=status
+    /// so the common poll skips serializing it.
+    /// Accepts the same clear/limit query parameters as /bot/inbox.
+    /// </summary>
+    private string HandleBotPoll(HttpListenerRequest request, HttpListenerResponse response)
+    {
+        var messages = ReadInbox(request);
+        response.AddHeader(InboxCountHeader, messages.Count.ToString());
+
+        if (request.QueryString["include"] == "status")
+        {
+            return JsonSerializer.Serialize(new
+            {
+                success = true,
+                status = BuildStatus(),
+                messageCount = messages.Count,
+                messages = messages
+            });
+        }
+        return JsonSerializer.Serialize(new
+        {
+            success = true,
+            messageCount = messages.Count,
+            messages = messages
+        });
+    }
+
+    private List<object> ReadInbox(HttpListenerRequest request)
     {
         // Parse query parameters
         bool clear = request.QueryString["clear"]?.ToLower() != "false";  // default true
@@ -3215,25 +3362,17 @@ public class VsaiModSystem : ModSystem
             limit = Math.Clamp(parsedLimit, 1, 100);
         }
 
-        List<object> messages;
         lock (_inboxLock)
         {
-            messages = _chatInbox.Take(limit)
+            var messages = _chatInbox.Take(limit)
                 .Select(m => (object)new { timestamp = m.Timestamp, player = m.PlayerName, message = m.Content })
                 .ToList();
             if (clear)
             {
                 _chatInbox.Clear();
             }
+            return messages;
         }
-
-        return JsonSerializer.Serialize(new
-        {
-            success = true,
-            botName = _botName,
-            messageCount = messages.Count,
-            messages = messages
-        });
     }
 
     private string HandleScreenshot(HttpListenerRequest request)
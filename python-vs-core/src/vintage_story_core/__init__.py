@@ -6,7 +6,7 @@ __version__ = "0.0.2"
 
 from .visibility import filter_visible_blocks, get_visible_surface_blocks
 from .types import Vec3, BlockInfo
-from .pathfinding import find_safe_path
+from .pathfinding import find_safe_path, build_terrain, Terrain
 
 __all__ = [
     "filter_visible_blocks",
@@ -14,4 +14,6 @@ __all__ = [
     "Vec3",
     "BlockInfo",
     "find_safe_path",
+    "build_terrain",
+    "Terrain",
 ]
@@ -7,6 +7,8 @@ respecting terrain rules for step heights, hazards, and reversibility.
 
 import heapq
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
@@ -103,6 +105,22 @@ def _has_hidden_collision(code: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=4096)
+def _classify_block_code(code: str) -> tuple[bool, bool, bool]:
+    """
+    Classify a block code as (is_liquid, is_passable, has_hidden_collision).
+
+    - is_passable: solid in the API but walkable through (see _is_passable_block)
+    - has_hidden_collision: isSolid=false but still blocks movement
+
+    A scan repeats a handful of codes thousands of times, so the string
+    matching runs once per distinct code rather than once per block.
+    """
+    code_lower = code.lower()
+    is_liquid = "water" in code_lower or "lava" in code_lower or "liquid" in code_lower
+    return is_liquid, _is_passable_block(code), _has_hidden_collision(code)
+
+
 def _build_terrain_data(
     blocks: list[dict[str, Any]],
     bot_y: int | None = None
@@ -132,15 +150,8 @@ def _build_terrain_data(
         else:
             x, y, z = int(block["x"]), int(block["y"]), int(block["z"])
 
-        code = block.get("code", "")
         is_solid = block.get("isSolid", True)
-        is_liquid = "water" in code.lower() or "lava" in code.lower() or "liquid" in code.lower()
-
-        # Check if block is passable (solid in API but walkable through)
-        is_passable = _is_passable_block(code)
-
-        # Check if block has hidden collision (isSolid=false but still blocks movement)
-        has_hidden_collision = _has_hidden_collision(code)
+        is_liquid, is_passable, has_hidden_collision = _classify_block_code(block.get("code", ""))
 
         if is_liquid:
             liquid_blocks.add((x, y, z))
@@ -247,6 +258,75 @@ def _has_body_clearance(
     return True
 
 
+def _is_enterable(
+    x: int,
+    z: int,
+    surface_y: int,
+    heightmap: dict[tuple[int, int], int],
+    solid_blocks: set[tuple[int, int, int]],
+    liquid_blocks: set[tuple[int, int, int]]
+) -> bool:
+    """
+    Check if the bot can step onto the surface at (x, z).
+
+    The cell must be free of liquid on and above the surface, and have body
+    clearance (see _has_body_clearance).
+    """
+    if (x, surface_y, z) in liquid_blocks or (x, surface_y + 1, z) in liquid_blocks:
+        return False
+    return _has_body_clearance(x, surface_y, z, solid_blocks, heightmap)
+
+
+def _find_enterable_cells(
+    heightmap: dict[tuple[int, int], int],
+    solid_blocks: set[tuple[int, int, int]],
+    liquid_blocks: set[tuple[int, int, int]]
+) -> set[tuple[int, int]]:
+    """
+    Find the (x, z) cells the bot can step onto (see _is_enterable).
+
+    Liquid and clearance depend only on the terrain, so a path request computes
+    them once for every cell; each neighbor check is then a single set probe.
+    """
+    return {
+        (x, z)
+        for (x, z), surface_y in heightmap.items()
+        if _is_enterable(x, z, surface_y, heightmap, solid_blocks, liquid_blocks)
+    }
+
+
+@dataclass(frozen=True)
+class Terrain:
+    """
+    Terrain parsed from one block scan, reusable across find_safe_path calls.
+
+    Build it with build_terrain() and pass it as find_safe_path(terrain=...)
+    to skip re-parsing the blocks when pathing repeatedly over the same scan.
+    """
+
+    heightmap: dict[tuple[int, int], int]
+    solid_blocks: set[tuple[int, int, int]]
+    liquid_blocks: set[tuple[int, int, int]]
+    enterable: set[tuple[int, int]]
+
+
+def build_terrain(blocks: list[dict[str, Any]], bot_y: int | None = None) -> Terrain:
+    """
+    Parse a block scan into a Terrain handle for find_safe_path.
+
+    Args:
+        blocks: Raw block data from /bot/blocks API
+        bot_y: Bot's Y position when the scan was taken; the heightmap prefers
+            surfaces near this level, as find_safe_path does (see _build_terrain_data)
+
+    Returns:
+        Terrain with the heightmap, obstacle sets and enterable cells
+    """
+    heightmap, solid_blocks, liquid_blocks = _build_terrain_data(blocks, bot_y=bot_y)
+    enterable = _find_enterable_cells(heightmap, solid_blocks, liquid_blocks)
+    return Terrain(heightmap, solid_blocks, liquid_blocks, enterable)
+
+
 def _get_walkable_neighbors(
     x: int,
     z: int,
@@ -254,7 +334,9 @@ def _get_walkable_neighbors(
     heightmap: dict[tuple[int, int], int],
     solid_blocks: set[tuple[int, int, int]],
     liquid_blocks: set[tuple[int, int, int]],
-    allow_2_block_drop: bool = False
+    allow_2_block_drop: bool = False,
+    escape_cache: dict[tuple[int, int], bool] | None = None,
+    enterable: set[tuple[int, int]] | None = None
 ) -> list[tuple[int, int, int, int]]:
     """
     Get walkable neighbor positions.
@@ -266,6 +348,10 @@ def _get_walkable_neighbors(
         solid_blocks: Set of solid block positions
         liquid_blocks: Set of liquid block positions
         allow_2_block_drop: If True, allow 2-block drops (non-reversible)
+        escape_cache: Optional (x, z) -> _can_escape_pit result memo, shared
+            across calls on the same terrain
+        enterable: Optional precomputed _find_enterable_cells result; liquid
+            and body clearance are checked per call when omitted
 
     Returns:
         List of (nx, nz, ny, cost) tuples for valid moves
@@ -277,13 +363,8 @@ def _get_walkable_neighbors(
         nx, nz = x + dx, z + dz
         key = (nx, nz)
 
-        if key not in heightmap:
-            continue
-
-        ny = heightmap[key]
-
-        # Check for liquid at destination (on or above surface)
-        if (nx, ny, nz) in liquid_blocks or (nx, ny + 1, nz) in liquid_blocks:
+        ny = heightmap.get(key)
+        if ny is None:
             continue
 
         # Calculate height difference
@@ -293,6 +374,13 @@ def _get_walkable_neighbors(
         if height_diff > 1:
             continue
 
+        # Check for liquid and body clearance at destination (both feet/body and head)
+        if enterable is None:
+            if not _is_enterable(nx, nz, ny, heightmap, solid_blocks, liquid_blocks):
+                continue
+        elif key not in enterable:
+            continue
+
         # Step down limits
         if height_diff < -1:
             if not allow_2_block_drop or height_diff < -2:
@@ -300,14 +388,21 @@ def _get_walkable_neighbors(
             # This is a 2-block drop (non-reversible move).
             # Before allowing it, verify the bot can escape from the landing position.
             # This does a limited BFS to check if higher ground is reachable.
-            if not _can_escape_pit(nx, nz, ny, heightmap, solid_blocks, liquid_blocks):
+            # The answer only depends on the landing cell, so it is memoized per search.
+            if escape_cache is None:
+                can_escape = _can_escape_pit(
+                    nx, nz, ny, heightmap, solid_blocks, liquid_blocks, enterable=enterable
+                )
+            else:
+                can_escape = escape_cache.get(key)
+                if can_escape is None:
+                    can_escape = _can_escape_pit(
+                        nx, nz, ny, heightmap, solid_blocks, liquid_blocks, enterable=enterable
+                    )
+                    escape_cache[key] = can_escape
+            if not can_escape:
                 continue
 
-        # Check for body clearance at destination (both feet/body and head)
-        # Pass heightmap to enable adjacent block checking for wider collision
-        if not _has_body_clearance(nx, ny, nz, solid_blocks, heightmap):
-            continue
-
         # Check for head clearance during transition for step up
         if height_diff == 1:
             # When stepping up, we need clearance at y+2 at current pos
@@ -325,6 +420,91 @@ def _get_walkable_neighbors(
     return neighbors
 
 
+def _get_walkable_predecessors(
+    x: int,
+    z: int,
+    surface_y: int,
+    start: tuple[int, int],
+    heightmap: dict[tuple[int, int], int],
+    solid_blocks: set[tuple[int, int, int]],
+    liquid_blocks: set[tuple[int, int, int]],
+    enterable: set[tuple[int, int]],
+    allow_2_block_drop: bool = False,
+    escape_cache: dict[tuple[int, int], bool] | None = None
+) -> list[tuple[int, int, int, float]]:
+    """
+    Get the positions the bot could step from onto (x, z), for backward search.
+
+    Mirrors _get_walkable_neighbors: a predecessor is returned only if
+    _get_walkable_neighbors would allow the move from it onto this position.
+    The check that this position itself is enterable is left to
+    the caller. Every predecessor other than the start must be enterable too,
+    since the bot had to step onto it earlier in the path.
+
+    Args:
+        x, z: Destination horizontal position
+        surface_y: Destination surface height
+        start: (x, z) of the search start, which need not be enterable
+        heightmap: Walkable surface heights
+        solid_blocks: Set of solid block positions
+        liquid_blocks: Set of liquid block positions
+        enterable: Precomputed _find_enterable_cells result
+        allow_2_block_drop: If True, allow 2-block drops (non-reversible)
+        escape_cache: Optional (x, z) -> _can_escape_pit result memo
+
+    Returns:
+        List of (px, pz, py, cost) tuples for valid moves onto (x, z)
+    """
+    predecessors = []
+    can_escape = None
+
+    for dx, dz in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        px, pz = x + dx, z + dz
+        key = (px, pz)
+
+        py = heightmap.get(key)
+        if py is None:
+            continue
+
+        if key != start and key not in enterable:
+            continue
+
+        # Height difference of the move from the predecessor onto (x, z)
+        height_diff = surface_y - py
+
+        if height_diff > 1:
+            continue
+
+        if height_diff < -1:
+            if not allow_2_block_drop or height_diff < -2:
+                continue
+            # 2-block drops need an escape from the landing position (x, z)
+            if can_escape is None:
+                landing = (x, z)
+                if escape_cache is not None and landing in escape_cache:
+                    can_escape = escape_cache[landing]
+                else:
+                    can_escape = _can_escape_pit(
+                        x, z, surface_y, heightmap, solid_blocks, liquid_blocks, enterable=enterable
+                    )
+                    if escape_cache is not None:
+                        escape_cache[landing] = can_escape
+            if not can_escape:
+                continue
+
+        # Stepping up needs head clearance at the predecessor
+        if height_diff == 1 and (px, py + 2, pz) in solid_blocks:
+            continue
+
+        cost = 1
+        if height_diff < 0:
+            cost = 1.1 if height_diff == -1 else 1.3
+
+        predecessors.append((px, pz, py, cost))
+
+    return predecessors
+
+
 def _can_escape_pit(
     x: int,
     z: int,
@@ -332,7 +512,8 @@ def _can_escape_pit(
     heightmap: dict[tuple[int, int], int],
     solid_blocks: set[tuple[int, int, int]],
     liquid_blocks: set[tuple[int, int, int]],
-    max_search: int = 16
+    max_search: int = 16,
+    enterable: set[tuple[int, int]] | None = None
 ) -> bool:
     """
     Check if a position can escape to higher ground via reversible moves.
@@ -348,6 +529,7 @@ def _can_escape_pit(
         solid_blocks: Set of solid block positions
         liquid_blocks: Set of liquid block positions
         max_search: Maximum positions to check (limits search cost)
+        enterable: Optional precomputed _find_enterable_cells result
 
     Returns:
         True if position can reach higher ground, False if it's a trap
@@ -372,29 +554,33 @@ def _can_escape_pit(
             if key in visited:
                 continue
 
-            if key not in heightmap:
+            ny = heightmap.get(key)
+            if ny is None:
                 continue
 
-            ny = heightmap[key]
+            height_diff = ny - cy
 
-            # Check for liquid
-            if (nx, ny, nz) in liquid_blocks or (nx, ny + 1, nz) in liquid_blocks:
+            # Only step-ups and reversible moves (same level, step-down-1) matter
+            if height_diff > 1 or height_diff < -1:
                 continue
 
-            height_diff = ny - cy
+            # Verify the destination is free of liquid and has body clearance
+            if enterable is None:
+                if not _is_enterable(nx, nz, ny, heightmap, solid_blocks, liquid_blocks):
+                    continue
+            elif key not in enterable:
+                continue
 
             # If we found a step-up, we can escape
             if height_diff == 1:
-                # Verify body clearance and head clearance for the step up
-                if _has_body_clearance(nx, ny, nz, solid_blocks, heightmap):
-                    if (cx, cy + 2, cz) not in solid_blocks:
-                        return True
+                # Verify head clearance for the step up
+                if (cx, cy + 2, cz) not in solid_blocks:
+                    return True
+                continue
 
             # For BFS, only explore same-level or step-down-1 (reversible from current)
-            if height_diff <= 0 and height_diff >= -1:
-                if _has_body_clearance(nx, ny, nz, solid_blocks, heightmap):
-                    visited.add(key)
-                    queue.append((nx, nz, ny))
+            visited.add(key)
+            queue.append((nx, nz, ny))
 
     return False
 
@@ -435,11 +621,10 @@ def _find_valid_start(
         check_z = bot_z + dz
         key = (check_x, check_z)
 
-        if key not in heightmap:
+        surface_y = heightmap.get(key)
+        if surface_y is None:
             continue
 
-        surface_y = heightmap[key]
-
         # Bot stands at surface_y + 1 (air block)
         # Allow tolerance of 2 to handle terrain variation and rounding
         # Expected: bot_y = surface_y + 1, so difference should be ~1
@@ -449,16 +634,52 @@ def _find_valid_start(
     return None
 
 
+def _find_level_l_path(
+    start: tuple[int, int, int],
+    goal: tuple[int, int],
+    heightmap: dict[tuple[int, int], int],
+    enterable: set[tuple[int, int]]
+) -> list[tuple[int, int, int]] | None:
+    """
+    Find a level path along one of the two axis-aligned L-shapes to the goal.
+
+    Every move costs at least 1, so |dx| + |dz| level moves is already an
+    optimal path. Tries x-first, then z-first.
+
+    Returns:
+        List of (x, y, z) positions from start to goal, or None if neither
+        L-shape is level and enterable throughout
+    """
+    start_x, start_y, start_z = start
+    goal_x, goal_z = goal
+
+    x_step = 1 if goal_x > start_x else -1
+    z_step = 1 if goal_z > start_z else -1
+    x_run = range(start_x + x_step, goal_x + x_step, x_step)
+    z_run = range(start_z + z_step, goal_z + z_step, z_step)
+
+    routes = [[(x, start_z) for x in x_run] + [(goal_x, z) for z in z_run]]
+    if start_x != goal_x and start_z != goal_z:
+        routes.append([(start_x, z) for z in z_run] + [(x, goal_z) for x in x_run])
+
+    for cells in routes:
+        if all(heightmap.get(cell) == start_y and cell in enterable for cell in cells):
+            return [start] + [(x, start_y, z) for x, z in cells]
+
+    return None
+
+
 def _astar(
     start: tuple[int, int, int],
     goal: tuple[int, int],
     heightmap: dict[tuple[int, int], int],
     solid_blocks: set[tuple[int, int, int]],
     liquid_blocks: set[tuple[int, int, int]],
-    allow_2_block_drop: bool = False
+    allow_2_block_drop: bool = False,
+    enterable: set[tuple[int, int]] | None = None
 ) -> list[tuple[int, int, int]] | None:
     """
-    A* pathfinding on the heightmap.
+    Bidirectional A* pathfinding on the heightmap.
 
     Args:
         start: (x, y, z) starting position
@@ -467,6 +688,7 @@ def _astar(
         solid_blocks: Set of solid block positions
         liquid_blocks: Set of liquid block positions
         allow_2_block_drop: Allow non-reversible 2-block drops
+        enterable: Precomputed _find_enterable_cells result (computed if omitted)
 
     Returns:
         List of (x, y, z) waypoints or None if no path found
@@ -480,46 +702,129 @@ def _astar(
     start_x, start_y, start_z = valid_start
     start_xz = (start_x, start_z)
 
-    # Priority queue: (f_score, counter, x, z, y)
-    counter = 0
-    open_set: list[tuple[float, int, int, int, int]] = []
-    heapq.heappush(open_set, (0, counter, start_xz[0], start_xz[1], start_y))
-
-    came_from: dict[tuple[int, int], tuple[int, int, int]] = {}
-    g_score: dict[tuple[int, int], float] = {start_xz: 0}
-    f_score: dict[tuple[int, int], float] = {start_xz: _heuristic(start_xz[0], start_xz[1], goal[0], goal[1])}
-
-    while open_set:
-        _, _, cx, cz, cy = heapq.heappop(open_set)
-        current = (cx, cz)
-
-        if current == goal:
-            # Reconstruct path
-            path = [(cx, cy, cz)]
-            while current in came_from:
-                px, py, pz = came_from[current]
-                path.append((px, py, pz))
-                current = (px, pz)
-            path.reverse()
+    if enterable is None:
+        enterable = _find_enterable_cells(heightmap, solid_blocks, liquid_blocks)
+
+    if start_xz == goal:
+        return [valid_start]
+
+    # The goal must be enterable for any move to end on it
+    if goal not in enterable:
+        return None
+    goal_x, goal_z = goal
+    goal_y = heightmap[goal]
+
+    # Open ground: a level straight or L-shaped route needs no search
+    if goal_y == start_y:
+        path = _find_level_l_path(valid_start, goal, heightmap, enterable)
+        if path is not None:
             return path
 
-        neighbors = _get_walkable_neighbors(
-            cx, cz, cy, heightmap, solid_blocks, liquid_blocks, allow_2_block_drop
-        )
+    # Bidirectional search: forward from the start and backward from the goal,
+    # always expanding the side whose frontier has the lower f. Priority queues
+    # hold (f_score, -g_score, x, z, y): ties on f pop the deeper node first, and
+    # entries superseded by a cheaper route are skipped when popped (lazy deletion).
+    initial_h = abs(goal_x - start_x) + abs(goal_z - start_z)
+    forward_open: list[tuple[float, float, int, int, int]] = [(initial_h, 0, start_x, start_z, start_y)]
+    backward_open: list[tuple[float, float, int, int, int]] = [(initial_h, 0, goal_x, goal_z, goal_y)]
+
+    forward_g: dict[tuple[int, int], float] = {start_xz: 0}
+    backward_g: dict[tuple[int, int], float] = {goal: 0}
+    came_from: dict[tuple[int, int], tuple[int, int, int]] = {}  # Previous waypoint toward the start
+    leads_to: dict[tuple[int, int], tuple[int, int, int]] = {}  # Next waypoint toward the goal
+    escape_cache: dict[tuple[int, int], bool] = {}
+
+    # Cheapest complete path seen so far, as the cell where the two searches met
+    best_cost = math.inf
+    meeting: tuple[int, int] | None = None
+
+    while forward_open and backward_open:
+        forward_f = forward_open[0][0]
+        backward_f = backward_open[0][0]
+
+        # Both heuristics are consistent, so once either frontier's lowest f
+        # reaches the best meeting cost, nothing left can beat it
+        if best_cost <= max(forward_f, backward_f):
+            break
+
+        if forward_f <= backward_f:
+            _, neg_g, cx, cz, cy = heapq.heappop(forward_open)
+            current = (cx, cz)
+            current_g = -neg_g
+
+            if current_g > forward_g[current] or current == goal:
+                continue
+
+            neighbors = _get_walkable_neighbors(
+                cx, cz, cy, heightmap, solid_blocks, liquid_blocks,
+                allow_2_block_drop, escape_cache, enterable
+            )
 
-        for nx, nz, ny, move_cost in neighbors:
-            neighbor_xz = (nx, nz)
-            tentative_g = g_score[current] + move_cost
+            for nx, nz, ny, move_cost in neighbors:
+                neighbor_xz = (nx, nz)
+                tentative_g = current_g + move_cost
+                known_g = forward_g.get(neighbor_xz)
+
+                if known_g is None or tentative_g < known_g:
+                    came_from[neighbor_xz] = (cx, cy, cz)
+                    forward_g[neighbor_xz] = tentative_g
+                    # Manhattan heuristic (_heuristic), inlined for the hot loop
+                    f = tentative_g + abs(goal_x - nx) + abs(goal_z - nz)
+                    heapq.heappush(forward_open, (f, -tentative_g, nx, nz, ny))
+
+                    remaining = backward_g.get(neighbor_xz)
+                    if remaining is not None and tentative_g + remaining < best_cost:
+                        best_cost = tentative_g + remaining
+                        meeting = neighbor_xz
+        else:
+            _, neg_g, cx, cz, cy = heapq.heappop(backward_open)
+            current = (cx, cz)
+            current_g = -neg_g
 
-            if neighbor_xz not in g_score or tentative_g < g_score[neighbor_xz]:
-                came_from[neighbor_xz] = (cx, cy, cz)
-                g_score[neighbor_xz] = tentative_g
-                f = tentative_g + _heuristic(nx, nz, goal[0], goal[1])
-                f_score[neighbor_xz] = f
-                counter += 1
-                heapq.heappush(open_set, (f, counter, nx, nz, ny))
+            if current_g > backward_g[current] or current == start_xz:
+                continue
 
-    return None
+            predecessors = _get_walkable_predecessors(
+                cx, cz, cy, start_xz, heightmap, solid_blocks, liquid_blocks,
+                enterable, allow_2_block_drop, escape_cache
+            )
+
+            for px, pz, py, move_cost in predecessors:
+                predecessor_xz = (px, pz)
+                tentative_g = current_g + move_cost
+                known_g = backward_g.get(predecessor_xz)
+
+                if known_g is None or tentative_g < known_g:
+                    leads_to[predecessor_xz] = (cx, cy, cz)
+                    backward_g[predecessor_xz] = tentative_g
+                    f = tentative_g + abs(start_x - px) + abs(start_z - pz)
+                    heapq.heappush(backward_open, (f, -tentative_g, px, pz, py))
+
+                    travelled = forward_g.get(predecessor_xz)
+                    if travelled is not None and tentative_g + travelled < best_cost:
+                        best_cost = tentative_g + travelled
+                        meeting = predecessor_xz
+
+    if meeting is None:
+        return None
+
+    # Reconstruct path: back from the meeting cell to the start, then on to the goal
+    meeting_y = start_y if meeting == start_xz else heightmap[meeting]
+    path = [(meeting[0], meeting_y, meeting[1])]
+    current = meeting
+    while current in came_from:
+        px, py, pz = came_from[current]
+        path.append((px, py, pz))
+        current = (px, pz)
+    path.reverse()
+
+    current = meeting
+    while current in leads_to:
+        nx, ny, nz = leads_to[current]
+        path.append((nx, ny, nz))
+        current = (nx, nz)
+
+    return path
 
 
 def _find_edge_goal(
@@ -537,26 +842,22 @@ def _find_edge_goal(
         return None
 
     # Calculate direction to target
-    dx = target[0] - start[0]
-    dz = target[1] - start[1]
-    dist = math.sqrt(dx * dx + dz * dz)
+    start_x, start_z = start
+    dx = target[0] - start_x
+    dz = target[1] - start_z
 
-    if dist == 0:
+    if dx == 0 and dz == 0:
         return start
 
-    # Normalize direction
-    dx_norm = dx / dist
-    dz_norm = dz / dist
-
-    # Find walkable positions and pick the one furthest in target direction
+    # Find walkable positions and pick the one furthest in target direction.
+    # Projecting onto the unnormalized (dx, dz) ranks positions the same way,
+    # and dropping the constant start offset keeps each score to two multiplies.
     best_pos = None
     best_score = float("-inf")
 
-    for pos in heightmap.keys():
-        # Score by projection onto target direction
-        px = pos[0] - start[0]
-        pz = pos[1] - start[1]
-        score = px * dx_norm + pz * dz_norm
+    for pos in heightmap:
+        x, z = pos
+        score = x * dx + z * dz
 
         if score > best_score:
             best_score = score
@@ -569,7 +870,8 @@ def find_safe_path(
     current_pos: dict[str, float],
     target_pos: dict[str, float],
     blocks: list[dict[str, Any]],
-    scan_radius: int = 16
+    scan_radius: int = 16,
+    terrain: Terrain | None = None
 ) -> dict[str, Any]:
     """
     Compute safe waypoints toward target within scanned area.
@@ -579,6 +881,8 @@ def find_safe_path(
         target_pos: Dict with x, y, z of target position
         blocks: Raw block data from /bot/blocks API
         scan_radius: Scan radius used (for determining edge-of-scan goals)
+        terrain: Prebuilt terrain from build_terrain(); when given, blocks is
+            not parsed again
 
     Returns:
         {
@@ -589,7 +893,7 @@ def find_safe_path(
             "reason": str  # if success=False
         }
     """
-    if not blocks:
+    if not blocks and terrain is None:
         return {
             "success": False,
             "waypoints": [],
@@ -607,7 +911,11 @@ def find_safe_path(
     target_z = int(math.floor(target_pos["z"]))
 
     # Build terrain data (pass bot_y to prefer surfaces at bot's level in buildings)
-    heightmap, solid_blocks, liquid_blocks = _build_terrain_data(blocks, bot_y=start_y)
+    if terrain is None:
+        terrain = build_terrain(blocks, bot_y=start_y)
+    heightmap = terrain.heightmap
+    solid_blocks = terrain.solid_blocks
+    liquid_blocks = terrain.liquid_blocks
 
     if not heightmap:
         return {
@@ -639,13 +947,22 @@ def find_safe_path(
                 "reason": "Cannot determine path toward target"
             }
 
+    # Enterable cells are shared by both search passes
+    enterable = terrain.enterable
+
     # Try pathfinding with reversible moves first
     start = (start_x, start_y, start_z)
-    path = _astar(start, goal_xz, heightmap, solid_blocks, liquid_blocks, allow_2_block_drop=False)
+    path = _astar(
+        start, goal_xz, heightmap, solid_blocks, liquid_blocks,
+        allow_2_block_drop=False, enterable=enterable
+    )
 
     # If no path with safe moves, try allowing 2-block drops
     if path is None:
-        path = _astar(start, goal_xz, heightmap, solid_blocks, liquid_blocks, allow_2_block_drop=True)
+        path = _astar(
+            start, goal_xz, heightmap, solid_blocks, liquid_blocks,
+            allow_2_block_drop=True, enterable=enterable
+        )
 
     if path is None:
         # Diagnose why pathfinding failed
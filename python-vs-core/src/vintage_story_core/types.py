@@ -22,7 +22,11 @@ class Vec3:
         return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
 
     def length(self) -> float:
-        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        return math.sqrt(self.length_sq())
+
+    def length_sq(self) -> float:
+        """Squared length; cheaper when only comparing distances."""
+        return self.x * self.x + self.y * self.y + self.z * self.z
 
     def normalize(self) -> "Vec3":
         length = self.length()
@@ -122,33 +122,22 @@ def _voxel_traversal(
     return (current_x, current_y, current_z) == target_block
 
 
-def filter_visible_blocks(
-    observer_pos: dict[str, float],
-    blocks: list[dict[str, Any]],
-    eye_height: float = 1.5,
-) -> list[dict[str, Any]]:
-    """
-    Filter a list of blocks to only those visible from the observer position.
-
-    Includes:
-    - Solid blocks visible via line-of-sight
-    - Liquid blocks visible via line-of-sight
-    - Non-solid blocks resting on solid ground (loose stones, plants, etc.)
-
-    Args:
-        observer_pos: Dict with x, y, z of observer (bot) position
-        blocks: List of block dicts from the API (with x, y, z, code fields)
-        eye_height: Height offset for observer's eyes (default 1.5)
+def _eye_position(
+    observer_pos: dict[str, float] | tuple[float, float, float],
+    eye_height: float,
+) -> Vec3:
+    """Observer eye position from an (x, y, z) tuple or an API position dict."""
+    if isinstance(observer_pos, dict):
+        x, y, z = observer_pos["x"], observer_pos["y"], observer_pos["z"]
+    else:
+        x, y, z = observer_pos
+    return Vec3(x, y + eye_height, z)
 
-    Returns:
-        List of visible block dicts
-    """
-    eye = Vec3(
-        observer_pos["x"],
-        observer_pos["y"] + eye_height,
-        observer_pos["z"],
-    )
 
+def _parse_blocks(
+    blocks: list[dict[str, Any]],
+) -> tuple[list[BlockInfo], set[tuple[int, int, int]]]:
+    """Parse API block dicts once, returning the infos and the solid positions."""
     block_infos: list[BlockInfo] = []
     solid_blocks: set[tuple[int, int, int]] = set()
 
@@ -158,14 +147,25 @@ def filter_visible_blocks(
         if info.is_solid:
             solid_blocks.add(info.to_tuple())
 
-    max_distance = 0.0
+    return block_infos, solid_blocks
+
+
+def _visible_indices(
+    eye: Vec3,
+    block_infos: list[BlockInfo],
+    solid_blocks: set[tuple[int, int, int]],
+) -> list[int]:
+    """Indices of the blocks visible from eye (see filter_visible_blocks)."""
+    # Compare squared distances and take a single sqrt at the end
+    max_distance_sq = 0.0
     for info in block_infos:
         block_center = Vec3(info.x + 0.5, info.y + 0.5, info.z + 0.5)
-        dist = (block_center - eye).length()
-        if dist > max_distance:
-            max_distance = dist
+        dist_sq = (block_center - eye).length_sq()
+        if dist_sq > max_distance_sq:
+            max_distance_sq = dist_sq
+    max_distance = math.sqrt(max_distance_sq)
 
-    visible_blocks: list[dict[str, Any]] = []
+    visible: list[int] = []
 
     for i, info in enumerate(block_infos):
         target = info.to_tuple()
@@ -178,13 +178,41 @@ def filter_visible_blocks(
                 continue
 
         if _voxel_traversal(eye, target, solid_blocks, max_distance):
-            visible_blocks.append(blocks[i])
+            visible.append(i)
 
-    return visible_blocks
+    return visible
+
+
+def filter_visible_blocks(
+    observer_pos: dict[str, float] | tuple[float, float, float],
+    blocks: list[dict[str, Any]],
+    eye_height: float = 1.5,
+) -> list[dict[str, Any]]:
+    """
+    Filter a list of blocks to only those visible from the observer position.
+
+    Includes:
+    - Solid blocks visible via line-of-sight
+    - Liquid blocks visible via line-of-sight
+    - Non-solid blocks resting on solid ground (loose stones, plants, etc.)
+
+    Args:
+        observer_pos: Observer (bot) position as an (x, y, z) tuple or a dict with x, y, z
+        blocks: List of block dicts from the API (with x, y, z, code fields)
+        eye_height: Height offset for observer's eyes (default 1.5)
+
+    Returns:
+        List of visible block dicts
+    """
+    eye = _eye_position(observer_pos, eye_height)
+
+    block_infos, solid_blocks = _parse_blocks(blocks)
+
+    return [blocks[i] for i in _visible_indices(eye, block_infos, solid_blocks)]
 
 
 def get_visible_surface_blocks(
-    observer_pos: dict[str, float],
+    observer_pos: dict[str, float] | tuple[float, float, float],
     blocks: list[dict[str, Any]],
     eye_height: float = 1.5,
     include_liquids: bool = True,
@@ -201,7 +229,7 @@ def get_visible_surface_blocks(
     - Non-solid blocks resting on solid ground (loose stones, plants, etc.)
 
     Args:
-        observer_pos: Dict with x, y, z of observer position
+        observer_pos: Observer position as an (x, y, z) tuple or a dict with x, y, z
         blocks: List of block dicts from the API
         eye_height: Height offset for observer's eyes
         include_liquids: Whether to include liquid blocks in output
@@ -209,14 +237,10 @@ def get_visible_surface_blocks(
     Returns:
         List of visible surface block dicts
     """
-    visible = filter_visible_blocks(observer_pos, blocks, eye_height)
-
-    solid_positions: set[tuple[int, int, int]] = set()
+    eye = _eye_position(observer_pos, eye_height)
 
-    for block_data in blocks:
-        info = BlockInfo.from_dict(block_data)
-        if info.is_solid:
-            solid_positions.add(info.to_tuple())
+    # Parse each block once and share the infos between both passes
+    block_infos, solid_positions = _parse_blocks(blocks)
 
     surface_blocks: list[dict[str, Any]] = []
     neighbor_offsets = [
@@ -228,8 +252,9 @@ def get_visible_surface_blocks(
         (0, 0, -1),
     ]
 
-    for block_data in visible:
-        info = BlockInfo.from_dict(block_data)
+    for i in _visible_indices(eye, block_infos, solid_positions):
+        info = block_infos[i]
+        block_data = blocks[i]
         pos = info.to_tuple()
 
         # Liquids are always surface blocks
@@ -239,7 +264,7 @@ def get_visible_surface_blocks(
             continue
 
         # Non-solid blocks resting on ground are always surface blocks
-        # (they already passed the "on solid ground" check in filter_visible_blocks)
+        # (they already passed the "on solid ground" check in _visible_indices)
         if not info.is_solid:
             surface_blocks.append(block_data)
             continue
@@ -5,8 +5,11 @@ Tests for safe pathfinding module.
 import pytest
 from vintage_story_core.pathfinding import (
     find_safe_path,
+    build_terrain,
     _build_terrain_data,
+    _find_enterable_cells,
     _get_walkable_neighbors,
+    _get_walkable_predecessors,
 )
 
 
@@ -480,6 +483,18 @@ class TestEdgeCases:
         assert result["success"] is True
         assert result["reached_target"] is True
 
+    def test_prebuilt_terrain_matches_blocks(self) -> None:
+        """A prebuilt terrain handle gives the same result as parsing blocks."""
+        blocks = make_flat_terrain(0, 0, 100, 6)
+        blocks.append(make_block(2, 101, 0))
+        blocks.append(make_block(2, 102, 0))
+        current = {"x": 0.5, "y": 101.0, "z": 0.5}
+        terrain = build_terrain(blocks, bot_y=101)
+
+        for target in ({"x": 5.5, "y": 101.0, "z": 0.5}, {"x": -4.5, "y": 101.0, "z": 3.5}):
+            expected = find_safe_path(current, target, blocks)
+            assert find_safe_path(current, target, [], terrain=terrain) == expected
+
 
 class TestBuildTerrainData:
     """Tests for internal terrain data building."""
@@ -620,3 +635,42 @@ class TestHiddenCollision:
         for wp in result["waypoints"]:
             if wp["x"] == 3:
                 assert wp["z"] < -5 or wp["z"] >= 6
+
+
+class TestBackwardSearch:
+    """Tests for the predecessor expansion used by the backward half of A*."""
+
+    def test_predecessors_mirror_neighbors(self) -> None:
+        """A cell's predecessors are exactly the cells whose neighbors include it."""
+        blocks = make_flat_terrain(0, 0, 100, 4)
+        # Step up, a 2-block drop with a way out, a low ceiling and some water
+        for z in range(-4, 5):
+            blocks.append(make_block(2, 101, z))
+        blocks = [b for b in blocks if not (b["x"] == -2 and b["z"] in (0, 1))]
+        blocks += [make_block(-2, 98, 0), make_block(-2, 99, 1), make_block(-2, 98, 1)]
+        blocks.append(make_block(0, 102, 2))
+        blocks.append({"x": 1, "y": 101, "z": -3, "code": "game:water-still-7", "isSolid": False})
+
+        heightmap, solid, liquid = _build_terrain_data(blocks)
+        enterable = _find_enterable_cells(heightmap, solid, liquid)
+        start = (0, 0)
+
+        for allow_drop in (False, True):
+            forward = {
+                (cell, (nx, nz))
+                for cell, y in heightmap.items()
+                if cell == start or cell in enterable
+                for nx, nz, _, _ in _get_walkable_neighbors(
+                    cell[0], cell[1], y, heightmap, solid, liquid, allow_drop
+                )
+            }
+            backward = {
+                ((px, pz), cell)
+                for cell, y in heightmap.items()
+                for px, pz, _, _ in _get_walkable_predecessors(
+                    cell[0], cell[1], y, start, heightmap, solid, liquid, enterable, allow_drop
+                )
+                if cell in enterable
+            }
+
+            assert forward == backward